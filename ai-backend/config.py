@@ -1,6 +1,8 @@
 import os
-from pydantic import BaseSettings
-from typing import List
+from functools import lru_cache
+from types import MappingProxyType
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Tuple
 
 class Settings(BaseSettings):
     # API Configuration
@@ -29,45 +31,53 @@ class Settings(BaseSettings):
     MODEL_UPDATE_INTERVAL: int = 3600  # seconds
     PREDICTION_CACHE_TTL: int = 300  # seconds
     MAX_PREDICTION_HORIZON: int = 168  # hours (1 week)
+    SAVED_MODEL_DIR: str = "./models"  # point at a shared volume for multi-worker serving
+    TFLITE_INFERENCE: bool = False  # serve price rollouts through quantized TFLite instead of the compiled graph
     
-    # Data Sources
-    SUPPORTED_TOKENS: List[str] = [
-        "ETH", "BTC", "USDC", "USDT", "DAI", "WETH", "MATIC", "ARB", "OP"
-    ]
-    
-    SUPPORTED_PROTOCOLS: List[str] = [
-        "aave", "compound", "uniswap", "curve", "convex", "yearn", "lido", "rocket-pool"
-    ]
-    
-    # ML Model Paths
-    PRICE_PREDICTION_MODEL_PATH: str = "./models/price_predictor.pkl"
-    YIELD_OPTIMIZATION_MODEL_PATH: str = "./models/yield_optimizer.pkl"
-    SENTIMENT_MODEL_PATH: str = "./models/sentiment_analyzer.pkl"
-    
-    # Feature Engineering
-    TECHNICAL_INDICATORS: List[str] = [
-        "sma_20", "sma_50", "ema_12", "ema_26", "rsi", "macd", "bollinger_bands",
-        "volume_sma", "price_change_24h", "volatility_7d"
-    ]
-    
-    # Risk Management
-    MAX_POSITION_SIZE: float = 0.3  # 30% max allocation per protocol
-    MIN_DIVERSIFICATION: int = 3  # minimum number of protocols
-    RISK_FREE_RATE: float = 0.02  # 2% annual risk-free rate
+    # Data Collection
+    FETCH_CONCURRENCY: int = 10  # max in-flight upstream fetches per collector
     
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
+
+@lru_cache
+def get_settings() -> Settings:
+    """Build the settings once per process and reuse the cached instance"""
+    return Settings()
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
+
+# Data Sources
+SUPPORTED_TOKENS: Tuple[str, ...] = (
+    "ETH", "BTC", "USDC", "USDT", "DAI", "WETH", "MATIC", "ARB", "OP"
+)
+
+SUPPORTED_PROTOCOLS: Tuple[str, ...] = (
+    "aave", "compound", "uniswap", "curve", "convex", "yearn", "lido", "rocket-pool"
+)
+
+# ML Model Paths
+PRICE_PREDICTION_MODEL_PATH = "./models/price_predictor.pkl"
+YIELD_OPTIMIZATION_MODEL_PATH = "./models/yield_optimizer.pkl"
+SENTIMENT_MODEL_PATH = "./models/sentiment_analyzer.pkl"
+
+# Feature Engineering
+TECHNICAL_INDICATORS: Tuple[str, ...] = (
+    "sma_20", "sma_50", "ema_12", "ema_26", "rsi", "macd", "bollinger_bands",
+    "volume_sma", "price_change_24h", "volatility_7d"
+)
+
+# Risk Management
+MAX_POSITION_SIZE = 0.3  # 30% max allocation per protocol
+MIN_DIVERSIFICATION = 3  # minimum number of protocols
+RISK_FREE_RATE = 0.02  # 2% annual risk-free rate
 
 # Model hyperparameters
-MODEL_CONFIG = {
+MODEL_CONFIG = MappingProxyType({
     "price_predictor": {
         "lstm_units": [64, 32, 16],
         "dropout_rate": 0.2,
@@ -99,13 +109,13 @@ MODEL_CONFIG = {
         "learning_rate": 2e-5,
         "epochs": 3
     }
-}
+})
 
 # Data collection intervals
-DATA_COLLECTION_INTERVALS = {
+DATA_COLLECTION_INTERVALS = MappingProxyType({
     "price_data": 60,  # 1 minute
     "protocol_data": 300,  # 5 minutes
     "news_sentiment": 900,  # 15 minutes
     "social_sentiment": 300,  # 5 minutes
     "on_chain_metrics": 600,  # 10 minutes
-}
\ No newline at end of file
+})
@@ -0,0 +1,20 @@
+"""Gunicorn settings for serving main_simple with multiple workers.
+
+    gunicorn -c gunicorn.conf.py main_simple:app
+
+The app is imported once in the master and the local chat model (when Gemini
+isn't configured) is loaded there too, so forked workers share the read-only
+weight pages copy-on-write instead of each holding their own copy.
+"""
+import os
+
+# Own variable so it never collides with main.py's API_PORT; -b/GUNICORN_CMD_ARGS still override
+bind = f"0.0.0.0:{os.getenv('SIMPLE_API_PORT', '8001')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+def on_starting(server):
+    import main_simple
+    if main_simple.gemini_model is None:
+        main_simple.load_ai_generator()
@@ -1,21 +1,50 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 from typing import List, Dict, Optional
 import uvicorn
 import asyncio
+import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from models.market_predictor import MarketPredictor
 from models.yield_optimizer import YieldOptimizer
 from services.data_service import DataService
 from services.real_time_analyzer import RealTimeAnalyzer
-from config import settings
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize AI models and services on startup, clean up on shutdown"""
+    # Built here rather than at import so importing main stays cheap and
+    # tests can swap in their own instances on app.state
+    app.state.market_predictor = MarketPredictor()
+    app.state.yield_optimizer = YieldOptimizer()
+    app.state.data_service = DataService()
+    app.state.real_time_analyzer = RealTimeAnalyzer()
+    
+    # The initializers are independent, so overlap their I/O
+    await asyncio.gather(
+        app.state.market_predictor.initialize(),
+        app.state.yield_optimizer.initialize(),
+        app.state.data_service.initialize()
+    )
+    await app.state.real_time_analyzer.start()
+    logger.info("AI Backend services initialized successfully")
+    yield
+    await app.state.real_time_analyzer.stop()
+    logger.info("AI Backend services shut down")
 
 app = FastAPI(
     title="DefiBrain AI Backend",
     description="AI/ML backend service for DefiBrain DeFi platform",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -23,147 +52,123 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "https://defibrain.app"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
-# Global instances
-market_predictor = MarketPredictor()
-yield_optimizer = YieldOptimizer()
-data_service = DataService()
-real_time_analyzer = RealTimeAnalyzer()
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Report any uncaught endpoint error as a 500 with the error message"""
+    logger.error(f"Unhandled error on {request.url.path}: {exc}")
+    return ORJSONResponse({"detail": str(exc)}, status_code=500)
 
 # Pydantic models
-class PredictionRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base for request bodies: immutable, and unknown keys are rejected by the validator"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+class PredictionRequest(RequestModel):
     tokens: List[str]
     timeframe: str = "1h"
     horizon: int = 24
 
-class OptimizationRequest(BaseModel):
+class OptimizationRequest(RequestModel):
     portfolio_value: float
     risk_tolerance: str
     protocols: List[str]
     current_positions: Dict[str, float]
 
-class MarketAnalysisRequest(BaseModel):
+class MarketAnalysisRequest(RequestModel):
     tokens: List[str]
     include_sentiment: bool = True
     include_technical: bool = True
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize AI models and services on startup"""
-    await market_predictor.initialize()
-    await yield_optimizer.initialize()
-    await data_service.initialize()
-    await real_time_analyzer.start()
-    print("AI Backend services initialized successfully")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    await real_time_analyzer.stop()
-    print("AI Backend services shut down")
-
 @app.get("/")
 async def root():
     return {"message": "DefiBrain AI Backend is running", "timestamp": datetime.now()}
 
 @app.get("/health")
-async def health_check():
+async def health_check(req: Request):
+    state = req.app.state
     return {
         "status": "healthy",
         "services": {
-            "market_predictor": market_predictor.is_ready(),
-            "yield_optimizer": yield_optimizer.is_ready(),
-            "data_service": data_service.is_ready(),
-            "real_time_analyzer": real_time_analyzer.is_running()
+            "market_predictor": state.market_predictor.is_ready(),
+            "yield_optimizer": state.yield_optimizer.is_ready(),
+            "data_service": state.data_service.is_ready(),
+            "real_time_analyzer": state.real_time_analyzer.is_running()
         }
     }
 
 @app.post("/api/v1/predict/prices")
-async def predict_prices(request: PredictionRequest):
+async def predict_prices(request: PredictionRequest, req: Request):
     """Predict token prices using ML models"""
-    try:
-        predictions = await market_predictor.predict_prices(
-            tokens=request.tokens,
-            timeframe=request.timeframe,
-            horizon=request.horizon
-        )
-        return {
-            "predictions": predictions,
-            "confidence": await market_predictor.get_confidence_scores(request.tokens),
-            "timestamp": datetime.now()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    predictions = await req.app.state.market_predictor.predict_prices(
+        tokens=request.tokens,
+        timeframe=request.timeframe,
+        horizon=request.horizon
+    )
+    return {
+        "predictions": predictions,
+        "confidence": await req.app.state.market_predictor.get_confidence_scores(request.tokens),
+        "timestamp": datetime.now()
+    }
 
 @app.post("/api/v1/optimize/yield")
-async def optimize_yield(request: OptimizationRequest):
+async def optimize_yield(request: OptimizationRequest, req: Request):
     """Optimize yield allocation using deep learning"""
-    try:
-        optimization = await yield_optimizer.optimize_allocation(
-            portfolio_value=request.portfolio_value,
-            risk_tolerance=request.risk_tolerance,
-            protocols=request.protocols,
-            current_positions=request.current_positions
-        )
-        return {
-            "optimization": optimization,
-            "expected_apy": optimization.get("expected_apy"),
-            "risk_score": optimization.get("risk_score"),
-            "timestamp": datetime.now()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    optimization = await req.app.state.yield_optimizer.optimize_allocation(
+        portfolio_value=request.portfolio_value,
+        risk_tolerance=request.risk_tolerance,
+        protocols=request.protocols,
+        current_positions=request.current_positions
+    )
+    return {
+        "optimization": optimization,
+        "expected_apy": optimization.get("expected_apy"),
+        "risk_score": optimization.get("risk_score"),
+        "timestamp": datetime.now()
+    }
 
 @app.post("/api/v1/analyze/market")
-async def analyze_market(request: MarketAnalysisRequest):
+async def analyze_market(request: MarketAnalysisRequest, req: Request):
     """Real-time market analysis with sentiment and technical indicators"""
-    try:
-        analysis = await real_time_analyzer.analyze_market(
-            tokens=request.tokens,
-            include_sentiment=request.include_sentiment,
-            include_technical=request.include_technical
-        )
-        return {
-            "analysis": analysis,
-            "timestamp": datetime.now()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    analysis = await req.app.state.real_time_analyzer.analyze_market(
+        tokens=request.tokens,
+        include_sentiment=request.include_sentiment,
+        include_technical=request.include_technical
+    )
+    return {
+        "analysis": analysis,
+        "timestamp": datetime.now()
+    }
 
 @app.get("/api/v1/insights/portfolio/{address}")
-async def get_portfolio_insights(address: str):
+async def get_portfolio_insights(address: str, req: Request):
     """Get AI-powered portfolio insights"""
-    try:
-        insights = await yield_optimizer.generate_portfolio_insights(address)
-        return {
-            "insights": insights,
-            "recommendations": insights.get("recommendations", []),
-            "risk_analysis": insights.get("risk_analysis", {}),
-            "timestamp": datetime.now()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    insights = await req.app.state.yield_optimizer.generate_portfolio_insights(address)
+    return {
+        "insights": insights,
+        "recommendations": insights.get("recommendations", []),
+        "risk_analysis": insights.get("risk_analysis", {}),
+        "timestamp": datetime.now()
+    }
 
 @app.get("/api/v1/data/protocols")
-async def get_protocol_data():
+async def get_protocol_data(req: Request):
     """Get current DeFi protocol data"""
-    try:
-        data = await data_service.get_protocol_data()
-        return {
-            "protocols": data,
-            "timestamp": datetime.now()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await req.app.state.data_service.get_protocol_data()
+    return {
+        "protocols": data,
+        "timestamp": datetime.now()
+    }
 
 if __name__ == "__main__":
+    settings = get_settings()
     uvicorn.run(
         "main:app",
-        host="0.0.0.0",
-        port=8000,
+        host=settings.API_HOST,
+        port=settings.API_PORT,
         reload=True,
         log_level="info"
     )
\ No newline at end of file
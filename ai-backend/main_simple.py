@@ -1,30 +1,46 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Dict, Any
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, field_validator
+from typing import List, Dict, Any, Optional, Tuple
 import uvicorn
 import logging
 import os
-from transformers import pipeline
+import re
+import time
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 import google.generativeai as genai
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+@lru_cache
+def _load_env() -> Dict[str, Optional[str]]:
+    """Parse .env once per process; forked workers inherit the result"""
+    return dotenv_values(find_dotenv())
+
+# Load environment variables from .env file if it exists, without
+# overriding values already set in the real environment
+os.environ.update({k: v for k, v in _load_env().items() if k not in os.environ and v is not None})
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize Gemini client
+GEMINI_GENERATION_CONFIG = {"temperature": 0.7, "max_output_tokens": 256}
+
 try:
     # Try to get Gemini API key from environment
     gemini_api_key = os.getenv("GEMINI_API_KEY")
     if gemini_api_key:
-        genai.configure(api_key=gemini_api_key)
-        gemini_model = genai.GenerativeModel('gemini-1.5-flash')
+        # REST transport keeps one persistent HTTP session for every chat call
+        genai.configure(api_key=gemini_api_key, transport="rest")
+        gemini_model = genai.GenerativeModel(
+            'gemini-1.5-flash',
+            generation_config=GEMINI_GENERATION_CONFIG
+        )
         logger.info("Gemini API client initialized successfully")
     else:
         gemini_model = None
@@ -33,25 +49,60 @@ except Exception as e:
     logger.warning(f"Failed to initialize Gemini client: {e}")
     gemini_model = None
 
-# Fallback: Try to load local transformers model
-ai_generator = None
-if not gemini_model:
-    try:
-        ai_generator = pipeline(
-            "text-generation",
-            model="microsoft/DialoGPT-medium",
-            tokenizer="microsoft/DialoGPT-medium",
-            device=-1  # Use CPU
-        )
-        logger.info("Local AI chat model loaded successfully")
-    except Exception as e:
-        logger.warning(f"Failed to load local AI model, using enhanced rule-based responses: {e}")
-        ai_generator = None
+# Fallback: local transformers model, loaded on first use only
+LOCAL_CHAT_MODEL = "microsoft/DialoGPT-medium"
+_ai_generator = None
+_ai_generator_eos_token_id = None
+_ai_generator_failed = False
+_ai_generator_lock = asyncio.Lock()
+
+def load_ai_generator():
+    """Load the local chat model into this process if it isn't loaded yet.
+
+    Called from the gunicorn ``on_starting`` hook so forked workers share the
+    weights copy-on-write, and lazily from ``get_ai_generator`` otherwise.
+    """
+    global _ai_generator, _ai_generator_eos_token_id, _ai_generator_failed
+    if _ai_generator is None and not _ai_generator_failed:
+        try:
+            from transformers import pipeline
+            _ai_generator = pipeline(
+                "text-generation",
+                model=LOCAL_CHAT_MODEL,
+                tokenizer=LOCAL_CHAT_MODEL,
+                device=-1  # Use CPU
+            )
+            _ai_generator_eos_token_id = _ai_generator.tokenizer.eos_token_id
+            logger.info("Local AI chat model loaded successfully")
+        except Exception as e:
+            logger.warning(f"Failed to load local AI model, using enhanced rule-based responses: {e}")
+            _ai_generator_failed = True
+    return _ai_generator
+
+async def get_ai_generator():
+    """Return the local chat model, loading it on the first call"""
+    if _ai_generator is not None or _ai_generator_failed:
+        return _ai_generator
+    async with _ai_generator_lock:
+        return await asyncio.to_thread(load_ai_generator)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the Gemini client so the first chat request skips connection setup"""
+    if gemini_model:
+        try:
+            await asyncio.to_thread(gemini_model.generate_content, "ping")
+            logger.info("Gemini client warmed up")
+        except Exception as e:
+            logger.warning(f"Gemini warm-up failed: {e}")
+    yield
 
 app = FastAPI(
     title="DefiBrain AI Backend",
     description="AI-powered DeFi analytics and optimization platform",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -59,32 +110,69 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 # Pydantic models
-class PortfolioData(BaseModel):
+class RequestModel(BaseModel):
+    """Base for request bodies: immutable, and unknown keys are rejected by the validator"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+class PortfolioData(RequestModel):
     portfolio_data: Dict[str, Any]
     vault_info: Dict[str, Any]
     tokens: List[str]
 
-class PricePredictionRequest(BaseModel):
+class PricePredictionRequest(RequestModel):
     tokens: List[str]
 
-class YieldOptimizationRequest(BaseModel):
+class YieldOptimizationRequest(RequestModel):
     portfolio_data: Dict[str, Any]
 
-class MarketAnalysisRequest(BaseModel):
+class MarketAnalysisRequest(RequestModel):
     tokens: List[str]
 
-class ChatRequest(BaseModel):
+class ChatTurn(RequestModel):
+    id: int
+    type: str
     message: str
-    portfolio_data: Dict[str, Any] = None
-    chat_history: List[Dict[str, Any]] = []
+    timestamp: str
+
+class PortfolioContext(BaseModel):
+    """Portfolio fields the chat uses; the frontend sends more, which are ignored"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
+    totalValue: float = 0.0
+    
+    @field_validator("totalValue", mode="before")
+    @classmethod
+    def _empty_total_value(cls, value):
+        # The frontend sends formatted strings and "" for an unloaded portfolio
+        return value if value not in ("", None) else 0.0
+    
+    def __bool__(self) -> bool:
+        # Like the raw dict it replaces, an empty portfolio ({}) counts as no portfolio
+        return bool(self.model_fields_set)
+
+class ChatRequest(RequestModel):
+    message: str
+    portfolio_data: Optional[PortfolioContext] = None
+    chat_history: List[ChatTurn] = []
+
+# Formatted wall-clock time, refreshed at most once per second
+_timestamp_cache = [0, ""]
+
+def current_timestamp() -> str:
+    """Return the current local time as "%Y-%m-%d %H:%M:%S", formatting once per second"""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[1] = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        _timestamp_cache[0] = now
+    return _timestamp_cache[1]
 
 # AI Response Generation
-async def generate_ai_response(user_message: str, portfolio_data: Dict[str, Any] = None) -> tuple[str, bool]:
+async def generate_ai_response(user_message: str, portfolio_data: Optional[PortfolioContext] = None) -> tuple[str, bool]:
     """Generate AI-powered response using Gemini API or fallback models"""
     try:
         # Try Gemini API first
@@ -94,16 +182,10 @@ async def generate_ai_response(user_message: str, portfolio_data: Dict[str, Any]
             
             user_context = f"{system_prompt}\n\nUser question: {user_message}"
             if portfolio_data:
-                total_value = portfolio_data.get('totalValue', 0)
-                if isinstance(total_value, str):
-                    total_value = float(total_value) if total_value else 0
-                user_context += f"\n\nUser's portfolio context: Total value ${total_value:.2f} with portfolio data available."
+                user_context += f"\n\nUser's portfolio context: Total value ${portfolio_data.totalValue:.2f} with portfolio data available."
             
-            # Make Gemini API call
-            response = await asyncio.to_thread(
-                gemini_model.generate_content,
-                user_context
-            )
+            # Make Gemini API call off the event loop
+            response = await asyncio.to_thread(gemini_model.generate_content, user_context)
             
             ai_response = response.text.strip()
             # Remove markdown formatting
@@ -112,24 +194,23 @@ async def generate_ai_response(user_message: str, portfolio_data: Dict[str, Any]
                 return clean_response, True
         
         # Fallback to local transformers model
+        ai_generator = await get_ai_generator() if not gemini_model else None
         if ai_generator:
             # Create context-aware prompt for DeFi
             context = f"You are a DeFi AI assistant helping users with decentralized finance strategies. User asks: {user_message}"
             
             if portfolio_data:
-                total_value = portfolio_data.get('totalValue', 0)
-                if isinstance(total_value, str):
-                    total_value = float(total_value) if total_value else 0
-                context += f" User's portfolio value: ${total_value:.2f}"
+                context += f" User's portfolio value: ${portfolio_data.totalValue:.2f}"
             
-            # Use AI model for response
-            response = ai_generator(
+            # Use AI model for response off the event loop
+            response = await asyncio.to_thread(
+                ai_generator,
                 context,
                 max_length=150,
                 num_return_sequences=1,
                 temperature=0.7,
                 do_sample=True,
-                pad_token_id=ai_generator.tokenizer.eos_token_id
+                pad_token_id=_ai_generator_eos_token_id
             )
             ai_response = response[0]['generated_text'].replace(context, '').strip()
             # Remove markdown formatting
@@ -146,50 +227,194 @@ async def generate_ai_response(user_message: str, portfolio_data: Dict[str, Any]
         logger.error(f"Error generating AI response: {e}")
         return generate_enhanced_response(user_message, portfolio_data), False
 
-def generate_enhanced_response(user_message: str, portfolio_data: Dict[str, Any] = None) -> str:
+# Intent keyword patterns, compiled once and checked in priority order.
+# A leading word boundary keeps e.g. "new" from matching inside "renew"
+# while still matching plurals like "risks" or "yields".
+RESPONSE_INTENTS = [
+    ("strategy", re.compile(r"\b(?:strategy|recommend|advice|what should)")),
+    ("risk", re.compile(r"\b(?:risk|safe|secure|protection)")),
+    ("yield", re.compile(r"\b(?:yield|apy|earn|profit|return)")),
+    ("market", re.compile(r"\b(?:market|price|trend|analysis)")),
+    ("beginner", re.compile(r"\b(?:beginner|start|new|how to)")),
+    ("gas", re.compile(r"\b(?:gas|fees|cost|expensive)")),
+    ("greeting", re.compile(r"\b(?:hello|hi|hey)\b")),
+]
+
+SUGGESTION_INTENTS = [
+    ("strategy", re.compile(r"\b(?:strategy|recommend)")),
+    ("risk", re.compile(r"\b(?:risk|safe)")),
+    ("yield", re.compile(r"\b(?:yield|apy|earn)")),
+    ("market", re.compile(r"\b(?:market|price|trend)")),
+]
+
+def match_intent(user_message: str, intents: List[Tuple[str, re.Pattern]]) -> Optional[str]:
+    """Return the first intent whose pattern matches the lowercased message"""
+    for name, pattern in intents:
+        if pattern.search(user_message):
+            return name
+    return None
+
+# Static segments of the templated responses, joined with the portfolio context per call
+STRATEGY_PREFIX = "Based on current DeFi market conditions,"
+STRATEGY_SUFFIX = "I recommend a diversified approach: 40% in established protocols like Aave or Compound for stable yields (3-8% APY), 30% in liquidity provision on Uniswap V3 for higher returns (8-15% APY), and 30% in emerging opportunities. Always consider your risk tolerance and market volatility."
+RISK_PREFIX = "Risk management is crucial in DeFi."
+RISK_SUFFIX = "Consider these strategies: diversify across multiple protocols, use established platforms with strong track records, implement stop-losses, and never invest more than you can afford to lose. Blue-chip DeFi protocols like Aave, Compound, and Uniswap offer relatively lower risk profiles."
+YIELD_PREFIX = "Current DeFi yields vary significantly:"
+YIELD_SUFFIX = "Stablecoin farming: 3-8% APY (low risk), LP provision: 8-15% APY (medium risk), Leveraged farming: 15-50% APY (high risk). "
+YIELD_POTENTIAL = "With your portfolio, you could potentially earn ${:.2f} annually at 8% APY or ${:.2f} at 15% APY."
+GREETING_PREFIX = "Hello! I'm your AI-powered DeFi assistant."
+GREETING_SUFFIX = "I can help you with portfolio optimization, yield strategies, risk assessment, market analysis, and protocol recommendations. What specific aspect of DeFi would you like to explore today?"
+PORTFOLIO_CONTEXT = " With your current portfolio value of ${:.2f}, "
+
+def _strategy_response(portfolio_context: str, has_portfolio: bool, total_value: float) -> str:
+    return STRATEGY_PREFIX + portfolio_context + STRATEGY_SUFFIX
+
+def _risk_response(portfolio_context: str, has_portfolio: bool, total_value: float) -> str:
+    return RISK_PREFIX + portfolio_context + RISK_SUFFIX
+
+def _yield_response(portfolio_context: str, has_portfolio: bool, total_value: float) -> str:
+    base_response = YIELD_PREFIX + portfolio_context + YIELD_SUFFIX
+    if has_portfolio and total_value > 0:
+        base_response += YIELD_POTENTIAL.format(total_value * 0.08, total_value * 0.15)
+    return base_response
+
+def _market_response(portfolio_context: str, has_portfolio: bool, total_value: float) -> str:
+    return "Current market analysis shows mixed signals across DeFi. ETH is showing consolidation patterns, while DeFi governance tokens are gaining momentum. Key factors to watch: Fed policy, regulatory developments, and protocol innovations. Consider dollar-cost averaging for new positions and monitoring key support/resistance levels."
+
+def _beginner_response(portfolio_context: str, has_portfolio: bool, total_value: float) -> str:
+    if has_portfolio and total_value == 0:
+        return "Since your portfolio is currently empty, focus on education before investing. Learn about: Smart Contract Audits: Crucial for identifying security risks before investing in any DeFi protocol. Look for audits by reputable firms. Impermanent Loss: Understand this risk inherent in liquidity provision. It's the potential loss compared to simply holding assets. Risk Tolerance: Define your risk appetite. High yield often means high risk. Start small with lower-risk strategies. Diversification: Don't put all your eggs in one basket. Spread investments across different protocols and assets. Gas Fees: Factor in transaction fees (especially on Ethereum) which can eat into profits. Start by researching reputable DeFi protocols and understanding their mechanics before committing any funds. Consider using smaller amounts initially to gain practical experience."
+    return "Welcome to DeFi! For beginners, I recommend starting with: 1) Learn the basics (wallets, gas fees, smart contracts), 2) Start small with established protocols like Aave or Compound, 3) Use stablecoins initially to understand mechanics, 4) Gradually explore liquidity provision and yield farming, 5) Always DYOR (Do Your Own Research) and never invest more than you can afford to lose."
+
+def _gas_response(portfolio_context: str, has_portfolio: bool, total_value: float) -> str:
+    return "Gas fees can significantly impact DeFi returns, especially for smaller amounts. Strategies to minimize costs: 1) Use Layer 2 solutions (Polygon, Arbitrum, Optimism), 2) Batch transactions when possible, 3) Monitor gas prices and transact during low-usage periods, 4) Consider protocols with lower fees, 5) Factor gas costs into your yield calculations."
+
+def _greeting_response(portfolio_context: str, has_portfolio: bool, total_value: float) -> str:
+    return GREETING_PREFIX + portfolio_context + GREETING_SUFFIX
+
+def _default_response(portfolio_context: str, has_portfolio: bool, total_value: float) -> str:
+    return "I'm here to help with your DeFi journey! I can provide insights on portfolio optimization, yield strategies, risk management, market analysis, and protocol recommendations. Could you be more specific about what you'd like to know? For example, ask about yield farming strategies, risk assessment, or market trends."
+
+RESPONSE_BUILDERS = {
+    "strategy": _strategy_response,
+    "risk": _risk_response,
+    "yield": _yield_response,
+    "market": _market_response,
+    "beginner": _beginner_response,
+    "gas": _gas_response,
+    "greeting": _greeting_response,
+    None: _default_response,
+}
+
+SUGGESTIONS = {
+    "strategy": (
+        "What's the best yield farming strategy?",
+        "How can I reduce portfolio risk?",
+        "Show me current market trends",
+        "Compare different DeFi protocols"
+    ),
+    "risk": (
+        "What are the safest DeFi protocols?",
+        "How to diversify my portfolio?",
+        "Tell me about insurance options",
+        "Explain impermanent loss"
+    ),
+    "yield": (
+        "Compare yield farming vs staking",
+        "What's the current best APY?",
+        "How to compound my earnings?",
+        "Explain liquidity mining"
+    ),
+    "market": (
+        "Analyze ETH price trends",
+        "What's driving DeFi growth?",
+        "Show me top performing tokens",
+        "Predict next market movement"
+    ),
+    None: (
+        "Optimize my portfolio",
+        "Find high-yield opportunities",
+        "Assess my risk level",
+        "Analyze market conditions"
+    ),
+}
+
+def generate_enhanced_response(user_message: str, portfolio_data: Optional[PortfolioContext] = None) -> str:
     """Enhanced rule-based responses with portfolio context"""
-    user_message = user_message.lower()
-    
+    has_portfolio = bool(portfolio_data)
+    total_value = portfolio_data.totalValue if has_portfolio else 0.0
+    return _cached_enhanced_response(user_message.lower(), has_portfolio, total_value)
+
+@lru_cache(maxsize=512)
+def _cached_enhanced_response(user_message: str, has_portfolio: bool, total_value: float) -> str:
+    """Build the rule-based response; keyed on hashable inputs so repeated prompts are free"""
     # Portfolio context
     portfolio_context = ""
-    if portfolio_data:
-        total_value = portfolio_data.get('totalValue', 0)
-        if isinstance(total_value, str):
-            total_value = float(total_value) if total_value else 0
-        if total_value > 0:
-            portfolio_context = f" With your current portfolio value of ${total_value:.2f}, "
-    
-    # More intelligent keyword matching
-    if any(word in user_message for word in ['strategy', 'recommend', 'advice', 'what should']):
-        return f"Based on current DeFi market conditions,{portfolio_context}I recommend a diversified approach: 40% in established protocols like Aave or Compound for stable yields (3-8% APY), 30% in liquidity provision on Uniswap V3 for higher returns (8-15% APY), and 30% in emerging opportunities. Always consider your risk tolerance and market volatility."
-    
-    elif any(word in user_message for word in ['risk', 'safe', 'secure', 'protection']):
-        return f"Risk management is crucial in DeFi.{portfolio_context}Consider these strategies: diversify across multiple protocols, use established platforms with strong track records, implement stop-losses, and never invest more than you can afford to lose. Blue-chip DeFi protocols like Aave, Compound, and Uniswap offer relatively lower risk profiles."
-    
-    elif any(word in user_message for word in ['yield', 'apy', 'earn', 'profit', 'return']):
-        base_response = f"Current DeFi yields vary significantly:{portfolio_context}Stablecoin farming: 3-8% APY (low risk), LP provision: 8-15% APY (medium risk), Leveraged farming: 15-50% APY (high risk). "
-        if portfolio_data and total_value > 0:
-            potential_8pct = total_value * 0.08
-            potential_15pct = total_value * 0.15
-            base_response += f"With your portfolio, you could potentially earn ${potential_8pct:.2f} annually at 8% APY or ${potential_15pct:.2f} at 15% APY."
-        return base_response
-    
-    elif any(word in user_message for word in ['market', 'price', 'trend', 'analysis']):
-        return "Current market analysis shows mixed signals across DeFi. ETH is showing consolidation patterns, while DeFi governance tokens are gaining momentum. Key factors to watch: Fed policy, regulatory developments, and protocol innovations. Consider dollar-cost averaging for new positions and monitoring key support/resistance levels."
-    
-    elif any(word in user_message for word in ['beginner', 'start', 'new', 'how to']):
-        if portfolio_data and total_value == 0:
-            return f"Since your portfolio is currently empty, focus on education before investing. Learn about: Smart Contract Audits: Crucial for identifying security risks before investing in any DeFi protocol. Look for audits by reputable firms. Impermanent Loss: Understand this risk inherent in liquidity provision. It's the potential loss compared to simply holding assets. Risk Tolerance: Define your risk appetite. High yield often means high risk. Start small with lower-risk strategies. Diversification: Don't put all your eggs in one basket. Spread investments across different protocols and assets. Gas Fees: Factor in transaction fees (especially on Ethereum) which can eat into profits. Start by researching reputable DeFi protocols and understanding their mechanics before committing any funds. Consider using smaller amounts initially to gain practical experience."
-        return "Welcome to DeFi! For beginners, I recommend starting with: 1) Learn the basics (wallets, gas fees, smart contracts), 2) Start small with established protocols like Aave or Compound, 3) Use stablecoins initially to understand mechanics, 4) Gradually explore liquidity provision and yield farming, 5) Always DYOR (Do Your Own Research) and never invest more than you can afford to lose."
+    if has_portfolio and total_value > 0:
+        portfolio_context = PORTFOLIO_CONTEXT.format(total_value)
     
-    elif any(word in user_message for word in ['gas', 'fees', 'cost', 'expensive']):
-        return "Gas fees can significantly impact DeFi returns, especially for smaller amounts. Strategies to minimize costs: 1) Use Layer 2 solutions (Polygon, Arbitrum, Optimism), 2) Batch transactions when possible, 3) Monitor gas prices and transact during low-usage periods, 4) Consider protocols with lower fees, 5) Factor gas costs into your yield calculations."
-    
-    elif any(word in user_message for word in ['hello', 'hi', 'hey']):
-        return f"Hello! I'm your AI-powered DeFi assistant.{portfolio_context}I can help you with portfolio optimization, yield strategies, risk assessment, market analysis, and protocol recommendations. What specific aspect of DeFi would you like to explore today?"
-    
-    else:
-        return "I'm here to help with your DeFi journey! I can provide insights on portfolio optimization, yield strategies, risk management, market analysis, and protocol recommendations. Could you be more specific about what you'd like to know? For example, ask about yield farming strategies, risk assessment, or market trends."
+    intent = match_intent(user_message, RESPONSE_INTENTS)
+    return RESPONSE_BUILDERS[intent](portfolio_context, has_portfolio, total_value)
+
+# Mock payloads, built once at import and shared across requests
+MOCK_PORTFOLIO_INSIGHTS = [
+    {
+        "id": "ai-opportunity-1",
+        "type": "opportunity",
+        "title": "AI-Detected High Yield Opportunity",
+        "description": "Machine learning models suggest optimal allocation to high-yield protocols.",
+        "confidence": 0.92,
+        "impact": "high",
+        "actionable": True,
+        "timestamp": 1640995200000
+    },
+    {
+        "id": "ai-risk-1",
+        "type": "risk",
+        "title": "Market Volatility Alert",
+        "description": "AI sentiment analysis indicates increased market volatility. Consider risk management.",
+        "confidence": 0.87,
+        "impact": "medium",
+        "actionable": True,
+        "timestamp": 1640995200000
+    }
+]
+
+MOCK_YIELD_RECOMMENDATIONS = [
+    {
+        "protocol": "Aave",
+        "apy": 12.5,
+        "risk_score": 0.3,
+        "allocation_percentage": 40
+    },
+    {
+        "protocol": "Compound",
+        "apy": 10.2,
+        "risk_score": 0.25,
+        "allocation_percentage": 35
+    },
+    {
+        "protocol": "Yearn",
+        "apy": 15.8,
+        "risk_score": 0.45,
+        "allocation_percentage": 25
+    }
+]
+
+PRICE_TEMPLATE = {"price": 1.0, "confidence": 0.85, "timeframe": "24h", "trend": "bullish"}
+TOKEN_PRICE = {"ETH": 2500.0, "BTC": 45000.0}
+
+SIGNAL_TEMPLATE = {
+    "signal": "hold",
+    "strength": 0.75,
+    "indicators": {
+        "rsi": 45.2,
+        "macd": 0.12,
+        "moving_average": 2480.0
+    },
+    "sentiment": 0.65
+}
+TOKEN_SIGNAL = {"ETH": "buy"}
 
 # Health check endpoint
 @app.get("/health")
@@ -201,30 +426,7 @@ async def health_check():
 async def get_portfolio_insights(request: PortfolioData):
     try:
         # Mock AI insights for now
-        insights = [
-            {
-                "id": "ai-opportunity-1",
-                "type": "opportunity",
-                "title": "AI-Detected High Yield Opportunity",
-                "description": "Machine learning models suggest optimal allocation to high-yield protocols.",
-                "confidence": 0.92,
-                "impact": "high",
-                "actionable": True,
-                "timestamp": 1640995200000
-            },
-            {
-                "id": "ai-risk-1",
-                "type": "risk",
-                "title": "Market Volatility Alert",
-                "description": "AI sentiment analysis indicates increased market volatility. Consider risk management.",
-                "confidence": 0.87,
-                "impact": "medium",
-                "actionable": True,
-                "timestamp": 1640995200000
-            }
-        ]
-        
-        return {"insights": insights}
+        return {"insights": MOCK_PORTFOLIO_INSIGHTS}
     except Exception as e:
         logger.error(f"Error generating portfolio insights: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate insights")
@@ -234,14 +436,10 @@ async def get_portfolio_insights(request: PortfolioData):
 async def predict_prices(request: PricePredictionRequest):
     try:
         # Mock price predictions
-        predictions = {}
-        for token in request.tokens:
-            predictions[token] = {
-                "price": 2500.0 if token == "ETH" else 45000.0 if token == "BTC" else 1.0,
-                "confidence": 0.85,
-                "timeframe": "24h",
-                "trend": "bullish"
-            }
+        predictions = {
+            token: {**PRICE_TEMPLATE, "price": TOKEN_PRICE.get(token, 1.0)}
+            for token in request.tokens
+        }
         
         return {"predictions": predictions}
     except Exception as e:
@@ -253,29 +451,8 @@ async def predict_prices(request: PricePredictionRequest):
 async def optimize_yield(request: YieldOptimizationRequest):
     try:
         # Mock yield optimization
-        recommendations = [
-            {
-                "protocol": "Aave",
-                "apy": 12.5,
-                "risk_score": 0.3,
-                "allocation_percentage": 40
-            },
-            {
-                "protocol": "Compound",
-                "apy": 10.2,
-                "risk_score": 0.25,
-                "allocation_percentage": 35
-            },
-            {
-                "protocol": "Yearn",
-                "apy": 15.8,
-                "risk_score": 0.45,
-                "allocation_percentage": 25
-            }
-        ]
-        
         return {
-            "recommendations": recommendations,
+            "recommendations": MOCK_YIELD_RECOMMENDATIONS,
             "expected_yield": 12.8,
             "risk_assessment": "medium"
         }
@@ -288,18 +465,10 @@ async def optimize_yield(request: YieldOptimizationRequest):
 async def analyze_market(request: MarketAnalysisRequest):
     try:
         # Mock market analysis
-        signals = {}
-        for token in request.tokens:
-            signals[token] = {
-                "signal": "buy" if token == "ETH" else "hold",
-                "strength": 0.75,
-                "indicators": {
-                    "rsi": 45.2,
-                    "macd": 0.12,
-                    "moving_average": 2480.0
-                },
-                "sentiment": 0.65
-            }
+        signals = {
+            token: {**SIGNAL_TEMPLATE, "signal": TOKEN_SIGNAL.get(token, "hold")}
+            for token in request.tokens
+        }
         
         return {
             "signals": signals,
@@ -315,7 +484,7 @@ async def analyze_market(request: MarketAnalysisRequest):
 async def ai_chat(request: ChatRequest):
     try:
         user_message = request.message
-        portfolio_data = request.portfolio_data or {}
+        portfolio_data = request.portfolio_data
         
         # Generate AI-powered response
         response, ai_used = await generate_ai_response(user_message, portfolio_data)
@@ -325,8 +494,8 @@ async def ai_chat(request: ChatRequest):
         
         return {
             "response": response,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "confidence": 0.95 if ai_used and gemini_model else (0.92 if ai_used and ai_generator else 0.85),
+            "timestamp": current_timestamp(),
+            "confidence": 0.95 if ai_used and gemini_model else (0.92 if ai_used and _ai_generator else 0.85),
             "suggestions": suggestions,
             "ai_powered": ai_used
         }
@@ -336,43 +505,11 @@ async def ai_chat(request: ChatRequest):
 
 def generate_contextual_suggestions(user_message: str) -> List[str]:
     """Generate contextual suggestions based on user message"""
-    user_message = user_message.lower()
-    
-    if any(word in user_message for word in ['strategy', 'recommend']):
-        return [
-            "What's the best yield farming strategy?",
-            "How can I reduce portfolio risk?",
-            "Show me current market trends",
-            "Compare different DeFi protocols"
-        ]
-    elif any(word in user_message for word in ['risk', 'safe']):
-        return [
-            "What are the safest DeFi protocols?",
-            "How to diversify my portfolio?",
-            "Tell me about insurance options",
-            "Explain impermanent loss"
-        ]
-    elif any(word in user_message for word in ['yield', 'apy', 'earn']):
-        return [
-            "Compare yield farming vs staking",
-            "What's the current best APY?",
-            "How to compound my earnings?",
-            "Explain liquidity mining"
-        ]
-    elif any(word in user_message for word in ['market', 'price', 'trend']):
-        return [
-            "Analyze ETH price trends",
-            "What's driving DeFi growth?",
-            "Show me top performing tokens",
-            "Predict next market movement"
-        ]
-    else:
-        return [
-            "Optimize my portfolio",
-            "Find high-yield opportunities",
-            "Assess my risk level",
-            "Analyze market conditions"
-        ]
+    return list(_cached_suggestions(user_message.lower()))
+
+@lru_cache(maxsize=256)
+def _cached_suggestions(user_message: str) -> Tuple[str, ...]:
+    return SUGGESTIONS[match_intent(user_message, SUGGESTION_INTENTS)]
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
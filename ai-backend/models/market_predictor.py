@@ -1,8 +1,13 @@
+import os
+
+# Bound oneDNN's primitive cache; must be set before TensorFlow is imported
+os.environ.setdefault("TF_ONEDNN_PRIMITIVE_CACHE_CAPACITY", "1024")
+
 import numpy as np
 import pandas as pd
 import tensorflow as tf
 from tensorflow.keras.models import Sequential, load_model
-from tensorflow.keras.layers import LSTM, Dense, Dropout, BatchNormalization
+from tensorflow.keras.layers import LSTM, Dense, Dropout
 from tensorflow.keras.optimizers import Adam
 from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
 from sklearn.preprocessing import MinMaxScaler
@@ -12,17 +17,185 @@ import asyncio
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
 import logging
+import hashlib
+import math
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
-from config import MODEL_CONFIG, settings
+from config import MODEL_CONFIG, SUPPORTED_TOKENS, settings
 from services.data_service import DataService
 from utils.technical_indicators import TechnicalIndicators
 
 logger = logging.getLogger(__name__)
 
+# Batch-1 LSTM steps gain nothing from parallel op scheduling; give the
+# cores to intra-op parallelism instead
+try:
+    tf.config.threading.set_intra_op_parallelism_threads(os.cpu_count() or 0)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+except RuntimeError as e:
+    # TensorFlow was already initialized elsewhere in the process
+    logger.warning(f"Could not configure TensorFlow threading: {e}")
+
+# Position of 'close' in the feature columns built by _prepare_features
+CLOSE_INDEX = 3
+
+# Lag offsets and rolling window sizes (in rows) for the derived price features
+LAG_STEPS = (1, 2, 3, 6, 12, 24)
+ROLLING_WINDOWS = (7, 14, 30)
+
+# Prepared feature frames kept in memory; only training frames are also
+# persisted to disk, one parquet file per token
+FEATURE_CACHE_SIZE = 16
+FEATURE_CACHE_DIR = "./cache"
+
+# Number of recent hourly closes behind the model confidence score
+CONFIDENCE_WINDOW = 24
+
+# Affine parameters of every token's feature/target scalers, in one archive
+SCALERS_PATH = "./models/scalers.npz"
+
+# Worker threads for TF training/inference; TF releases the GIL inside its ops
+TF_WORKERS = min(4, os.cpu_count() or 1)
+
+def build_predict_step(model, sequence_length: int, n_features: int, scaling: Tuple[np.ndarray, ...]):
+    """Build a compiled step that predicts the next price and rolls the scaled input sequence"""
+    scale, offset, y_scale, y_offset = scaling
+    close_scale = tf.constant(scale[CLOSE_INDEX], dtype=tf.float32)
+    close_offset = tf.constant(offset[CLOSE_INDEX], dtype=tf.float32)
+    y_scale = tf.constant(y_scale[0], dtype=tf.float32)
+    y_offset = tf.constant(y_offset[0], dtype=tf.float32)
+    
+    @tf.function(
+        jit_compile=True,
+        input_signature=[tf.TensorSpec([None, sequence_length, n_features], tf.float32)]
+    )
+    def predict_step(sequence):
+        # Invert the target scaling to get a price
+        price = (model(sequence, training=False) - y_offset) / y_scale
+        # Carry the last row forward with the predicted close, in feature scale
+        # (simplified; in practice you'd want to update with actual features)
+        last_row = sequence[:, -1:, :]
+        new_row = tf.concat([
+            last_row[:, :, :CLOSE_INDEX],
+            tf.reshape(price * close_scale + close_offset, [-1, 1, 1]),
+            last_row[:, :, CLOSE_INDEX + 1:]
+        ], axis=2)
+        return price, tf.concat([sequence[:, 1:, :], new_row], axis=1)
+    
+    return predict_step
+
+def build_rollout(model, sequence_length: int, n_features: int, scaling: Tuple[np.ndarray, ...]):
+    """Build a graph that runs the whole autoregressive rollout in one call.
+
+    The input is the unscaled feature window and the output is in price
+    units; the MinMax feature scaling and the inverse target scaling are
+    applied in-graph from float32 constants. The horizon loop is a
+    tf.while_loop writing into a TensorArray, so there is no Python
+    dispatch per step.
+    """
+    predict_step = build_predict_step(model, sequence_length, n_features, scaling)
+    scale = tf.constant(scaling[0], dtype=tf.float32)
+    offset = tf.constant(scaling[1], dtype=tf.float32)
+    
+    @tf.function(input_signature=[
+        tf.TensorSpec([None, sequence_length, n_features], tf.float32),
+        tf.TensorSpec([], tf.int32)
+    ])
+    def rollout(sequence, horizon):
+        sequence = sequence * scale + offset
+        preds = tf.TensorArray(tf.float32, size=horizon)
+        for i in tf.range(horizon):
+            pred, sequence = predict_step(sequence)
+            preds = preds.write(i, pred[:, 0])
+        # (horizon, batch) -> (batch, horizon)
+        return tf.transpose(preds.stack())
+    
+    return rollout
+
+class TFLitePredictor:
+    """Runs a converted price model through the TFLite interpreter"""
+    
+    def __init__(self, model_path: str):
+        self.interpreter = tf.lite.Interpreter(model_path=model_path)
+        self.interpreter.allocate_tensors()
+        self.input_index = self.interpreter.get_input_details()[0]['index']
+        self.output_index = self.interpreter.get_output_details()[0]['index']
+        # An interpreter is not thread-safe; calls come from the TF worker pool
+        self._lock = threading.Lock()
+    
+    def __call__(self, sequence: np.ndarray) -> np.ndarray:
+        with self._lock:
+            self.interpreter.set_tensor(self.input_index, sequence)
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(self.output_index)
+
+def affine_params(scaler: MinMaxScaler) -> Tuple[np.ndarray, np.ndarray]:
+    """float32 (scale, offset) such that x * scale + offset == scaler.transform(x)"""
+    return scaler.scale_.astype(np.float32), scaler.min_.astype(np.float32)
+
+def price_timestamps(data: pd.DataFrame) -> pd.Series:
+    """Timestamps of a price frame, whether stored as a column or as the index"""
+    if 'timestamp' in data.columns:
+        return data['timestamp']
+    return data.index.to_series()
+
+class RollingVolatility:
+    """Coefficient of variation over the last `window` prices.
+
+    Mean and sum of squared deviations are updated with a sliding Welford
+    step, so adding a price costs O(1) instead of a pass over the window.
+    """
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.last_timestamp = None
+    
+    def push(self, value: float):
+        value = float(value)
+        if len(self.values) == self.window:
+            # Replace the oldest value, keeping n fixed
+            oldest = self.values[0]
+            new_mean = self.mean + (value - oldest) / self.window
+            self.m2 += (value - oldest) * (value - new_mean + oldest - self.mean)
+            self.mean = new_mean
+        else:
+            delta = value - self.mean
+            self.mean += delta / (len(self.values) + 1)
+            self.m2 += delta * (value - self.mean)
+        self.values.append(value)
+    
+    @property
+    def volatility(self) -> float:
+        # Population std, matching np.std
+        return math.sqrt(max(self.m2, 0.0) / len(self.values)) / self.mean
+
+class DummyPredictor:
+    """Numpy stand-in for tokens without enough data: repeats the last close"""
+    
+    def __init__(self, last_close: float = 0.0):
+        self.last_close = float(last_close)
+    
+    def __call__(self, sequence: Optional[np.ndarray] = None) -> np.ndarray:
+        if sequence is not None and sequence.size:
+            return np.array([[sequence[0, -1, CLOSE_INDEX]]], dtype=np.float32)
+        return np.array([[self.last_close]], dtype=np.float32)
+
 class MarketPredictor:
     def __init__(self):
         self.models = {}
         self.scalers = {}
+        self._scaler_store = {}
+        self._scaler_store_lock = threading.Lock()
+        self.interpreters = {}
+        self._rollouts = {}
+        self._feature_cache = OrderedDict()
+        self._volatility = {}
+        self._tf_pool = ThreadPoolExecutor(max_workers=TF_WORKERS, thread_name_prefix="tf")
         self.is_initialized = False
         self.data_service = DataService()
         self.technical_indicators = TechnicalIndicators()
@@ -44,27 +217,75 @@ class MarketPredictor:
     
     async def _load_or_train_models(self):
         """Load existing models or train new ones"""
-        for token in settings.SUPPORTED_TOKENS:
-            try:
-                # Try to load existing model
-                model_path = f"./models/price_predictor_{token.lower()}.h5"
-                scaler_path = f"./models/scaler_{token.lower()}.pkl"
-                
-                if self._model_exists(model_path, scaler_path):
-                    self.models[token] = load_model(model_path)
-                    self.scalers[token] = joblib.load(scaler_path)
-                    logger.info(f"Loaded existing model for {token}")
-                else:
-                    # Train new model
-                    await self._train_model(token)
-                    logger.info(f"Trained new model for {token}")
-            except Exception as e:
-                logger.error(f"Error loading/training model for {token}: {e}")
+        self._scaler_store = self._read_scaler_store()
+        await asyncio.gather(*(self._load_or_train_model(token) for token in SUPPORTED_TOKENS))
+    
+    async def _load_or_train_model(self, token: str):
+        """Load the existing model for a token or train a new one"""
+        try:
+            # Try to load existing model
+            model_path = f"./models/price_predictor_{token.lower()}.h5"
+            scaling = self._stored_scaling(token)
+            
+            if os.path.exists(model_path) and scaling is not None:
+                self.scalers[token] = scaling
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._tf_pool, self._load_model, token, model_path)
+                logger.info(f"Loaded existing model for {token}")
+            else:
+                # Train new model
+                await self._train_model(token)
+                logger.info(f"Trained new model for {token}")
+        except Exception as e:
+            logger.error(f"Error loading/training model for {token}: {e}")
+    
+    def _load_model(self, token: str, model_path: str):
+        """Load a token's rollout graph, plus its TFLite model when opted in"""
+        restored = None
+        saved_model_path = self._saved_model_path(token)
+        if os.path.isdir(saved_model_path):
+            # Restore the already-traced graph instead of the Keras model; its
+            # variables are read from the shared export rather than rebuilt
+            restored = getattr(tf.saved_model.load(saved_model_path), 'forecast', None)
+        if restored is not None:
+            self._rollouts[token] = restored
+        else:
+            self.models[token] = load_model(model_path)
+            self._export_rollout(token)
+        if settings.TFLITE_INFERENCE:
+            self._load_tflite_model(token)
     
-    def _model_exists(self, model_path: str, scaler_path: str) -> bool:
-        """Check if model files exist"""
-        import os
-        return os.path.exists(model_path) and os.path.exists(scaler_path)
+    def _read_scaler_store(self) -> Dict[str, np.ndarray]:
+        """Read every token's scaler parameters from the shared archive"""
+        if not os.path.exists(SCALERS_PATH):
+            return {}
+        with np.load(SCALERS_PATH) as archive:
+            return {key: archive[key] for key in archive.files}
+    
+    def _stored_scaling(self, token: str) -> Optional[Tuple[np.ndarray, ...]]:
+        """Saved (scale, offset, y_scale, y_offset) for a token, falling back to legacy scaler pickles"""
+        if f"{token}_y_scale" in self._scaler_store:
+            return tuple(
+                self._scaler_store[f"{token}_{name}"] for name in ("scale", "offset", "y_scale", "y_offset")
+            )
+        scaler_path = f"./models/scaler_{token.lower()}.pkl"
+        y_scaler_path = f"./models/y_scaler_{token.lower()}.pkl"
+        if os.path.exists(scaler_path) and os.path.exists(y_scaler_path):
+            return (*affine_params(joblib.load(scaler_path)), *affine_params(joblib.load(y_scaler_path)))
+        return None
+    
+    def _store_scalers(self, token: str, scaler: MinMaxScaler, y_scaler: MinMaxScaler):
+        """Add a token's feature and target scalers to the shared archive"""
+        with self._scaler_store_lock:
+            scale, offset = affine_params(scaler)
+            y_scale, y_offset = affine_params(y_scaler)
+            self._scaler_store.update({
+                f"{token}_scale": scale,
+                f"{token}_offset": offset,
+                f"{token}_y_scale": y_scale,
+                f"{token}_y_offset": y_offset
+            })
+            np.savez_compressed(SCALERS_PATH, **self._scaler_store)
     
     async def _train_model(self, token: str):
         """Train LSTM model for a specific token"""
@@ -75,20 +296,25 @@ class MarketPredictor:
         
         if data is None or len(data) < 100:
             logger.warning(f"Insufficient data for {token}, using dummy model")
-            self._create_dummy_model(token)
+            self._create_dummy_model(token, data)
             return
         
         # Prepare features
-        features_df = await self._prepare_features(data, token)
+        features_df = await self._prepare_features(data, token, persist=True)
         
         # Create sequences for LSTM
         X, y = self._create_sequences(features_df)
         
         if len(X) == 0:
             logger.warning(f"No sequences created for {token}, using dummy model")
-            self._create_dummy_model(token)
+            self._create_dummy_model(token, data)
             return
         
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._tf_pool, self._fit_model, token, X, y)
+    
+    def _fit_model(self, token: str, X: np.ndarray, y: np.ndarray):
+        """Fit, save and evaluate the LSTM for a token on prepared sequences"""
         # Split data
         split_idx = int(len(X) * 0.8)
         X_train, X_test = X[:split_idx], X[split_idx:]
@@ -104,8 +330,19 @@ class MarketPredictor:
         y_train_scaled = y_scaler.fit_transform(y_train.reshape(-1, 1)).flatten()
         y_test_scaled = y_scaler.transform(y_test.reshape(-1, 1)).flatten()
         
-        # Build model
-        model = self._build_lstm_model(X_train.shape[1], X_train.shape[2])
+        # Stream batches through tf.data so host-to-device copies overlap training
+        batch_size = self.config["batch_size"]
+        train_ds = (
+            tf.data.Dataset.from_tensor_slices((X_train_scaled, y_train_scaled))
+            .shuffle(len(X_train_scaled))
+            .batch(batch_size)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        val_ds = (
+            tf.data.Dataset.from_tensor_slices((X_test_scaled, y_test_scaled))
+            .batch(batch_size)
+            .prefetch(tf.data.AUTOTUNE)
+        )
         
         # Train model
         callbacks = [
@@ -113,25 +350,30 @@ class MarketPredictor:
             ReduceLROnPlateau(factor=0.5, patience=5)
         ]
         
-        model.fit(
-            X_train_scaled, y_train_scaled,
-            validation_data=(X_test_scaled, y_test_scaled),
-            epochs=self.config["epochs"],
-            batch_size=self.config["batch_size"],
-            callbacks=callbacks,
-            verbose=0
-        )
+        with tf.device(self._training_device(token)):
+            # Build model
+            model = self._build_lstm_model(X_train.shape[1], X_train.shape[2])
+            
+            model.fit(
+                train_ds,
+                validation_data=val_ds,
+                epochs=self.config["epochs"],
+                callbacks=callbacks,
+                verbose=0
+            )
         
         # Save model and scalers
         model.save(f"./models/price_predictor_{token.lower()}.h5")
-        joblib.dump(scaler, f"./models/scaler_{token.lower()}.pkl")
-        joblib.dump(y_scaler, f"./models/y_scaler_{token.lower()}.pkl")
+        self._store_scalers(token, scaler, y_scaler)
         
         self.models[token] = model
-        self.scalers[token] = scaler
+        self.scalers[token] = (*affine_params(scaler), *affine_params(y_scaler))
+        self._export_rollout(token)
+        if settings.TFLITE_INFERENCE:
+            self._load_tflite_model(token, representative_data=X_train_scaled)
         
         # Evaluate model
-        y_pred = model.predict(X_test_scaled)
+        y_pred = model(X_test_scaled, training=False).numpy()
         y_pred_unscaled = y_scaler.inverse_transform(y_pred.reshape(-1, 1)).flatten()
         y_test_unscaled = y_scaler.inverse_transform(y_test_scaled.reshape(-1, 1)).flatten()
         
@@ -140,46 +382,114 @@ class MarketPredictor:
         
         logger.info(f"Model for {token} - MSE: {mse:.4f}, MAE: {mae:.4f}")
     
-    def _create_dummy_model(self, token: str):
-        """Create a simple dummy model for tokens with insufficient data"""
-        model = Sequential([
-            Dense(32, activation='relu', input_shape=(10,)),
-            Dense(16, activation='relu'),
-            Dense(1)
-        ])
-        model.compile(optimizer='adam', loss='mse')
-        
-        # Create dummy scaler
-        scaler = MinMaxScaler()
-        dummy_data = np.random.randn(100, 10)
-        scaler.fit(dummy_data)
-        
-        self.models[token] = model
-        self.scalers[token] = scaler
+    def _training_device(self, token: str) -> str:
+        """Device to train the token's model on, spreading tokens over the GPUs"""
+        gpus = tf.config.list_physical_devices('GPU')
+        if not gpus:
+            return '/CPU:0'
+        slot = SUPPORTED_TOKENS.index(token) if token in SUPPORTED_TOKENS else 0
+        return f'/GPU:{slot % len(gpus)}'
+    
+    def _saved_model_path(self, token: str) -> str:
+        """SavedModel export for the token, keyed by a digest of its .h5 weights and
+        the scaling baked into the graph, so every worker reuses the same export
+        until the model is retrained"""
+        digest = hashlib.sha256()
+        with open(f"./models/price_predictor_{token.lower()}.h5", "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        for params in self.scalers[token]:
+            digest.update(np.ascontiguousarray(params, dtype=np.float32).tobytes())
+        return os.path.join(
+            settings.SAVED_MODEL_DIR, f"saved_model_{token.lower()}_{digest.hexdigest()[:16]}"
+        )
+    
+    def _tflite_path(self, token: str) -> str:
+        return f"./models/price_predictor_{token.lower()}.tflite"
+    
+    def _convert_to_tflite(self, token: str, representative_data: Optional[np.ndarray] = None):
+        """Convert the token's Keras model to a quantized TFLite flatbuffer next to the .h5.
+
+        With training samples available the weights and activations are
+        calibrated to int8; otherwise the weights are stored as float16.
+        """
+        if token not in self.models:
+            self.models[token] = load_model(f"./models/price_predictor_{token.lower()}.h5")
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.models[token])
+        converter.experimental_new_converter = True
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        if representative_data is not None:
+            def representative_dataset():
+                for i in range(min(100, len(representative_data))):
+                    yield [representative_data[i:i+1].astype(np.float32)]
+            converter.representative_dataset = representative_dataset
+        else:
+            converter.target_spec.supported_types = [tf.float16]
+        with open(self._tflite_path(token), "wb") as f:
+            f.write(converter.convert())
+    
+    def _load_tflite_model(self, token: str, representative_data: Optional[np.ndarray] = None):
+        """Load the TFLite model used for inference, converting it when freshly
+        trained (representative_data given) or when no converted file exists"""
+        try:
+            if representative_data is not None or not os.path.exists(self._tflite_path(token)):
+                self._convert_to_tflite(token, representative_data)
+            self.interpreters[token] = TFLitePredictor(self._tflite_path(token))
+        except Exception as e:
+            # Keep serving through the Keras graph path
+            logger.warning(f"TFLite model unavailable for {token}: {e}")
+            self.interpreters.pop(token, None)
+    
+    def _create_dummy_model(self, token: str, data: Optional[pd.DataFrame] = None):
+        """Create a last-price fallback for tokens with insufficient data"""
+        last_close = 0.0
+        if data is not None and len(data):
+            last_close = data['close'].iloc[-1]
+        
+        self.models[token] = DummyPredictor(last_close)
+        self.scalers.pop(token, None)
+        self.interpreters.pop(token, None)
+        self._rollouts.pop(token, None)
+    
+    def _has_model(self, token: str) -> bool:
+        """Whether the token has a trained model or a dummy fallback"""
+        return token in self.scalers or isinstance(self.models.get(token), DummyPredictor)
     
     def _build_lstm_model(self, sequence_length: int, n_features: int) -> Sequential:
         """Build LSTM model architecture"""
         model = Sequential()
         
+        # Keep every LSTM eligible for the fused cuDNN kernel: default
+        # tanh/sigmoid activations, no recurrent dropout, no unrolling, and
+        # no BatchNormalization between the recurrent layers. On CPU,
+        # implementation=2 computes all four gate projections as one matmul.
+        cudnn_kwargs = dict(
+            implementation=2,
+            activation='tanh',
+            recurrent_activation='sigmoid',
+            recurrent_dropout=0.0,
+            use_bias=True,
+            unroll=False,
+            dropout=self.config["dropout_rate"]
+        )
+        
         # First LSTM layer
         model.add(LSTM(
             self.config["lstm_units"][0],
             return_sequences=True,
-            input_shape=(sequence_length, n_features)
+            input_shape=(sequence_length, n_features),
+            **cudnn_kwargs
         ))
-        model.add(Dropout(self.config["dropout_rate"]))
-        model.add(BatchNormalization())
         
         # Second LSTM layer
         model.add(LSTM(
             self.config["lstm_units"][1],
-            return_sequences=True
+            return_sequences=True,
+            **cudnn_kwargs
         ))
-        model.add(Dropout(self.config["dropout_rate"]))
-        model.add(BatchNormalization())
         
         # Third LSTM layer
-        model.add(LSTM(self.config["lstm_units"][2]))
+        model.add(LSTM(self.config["lstm_units"][2], **cudnn_kwargs))
         model.add(Dropout(self.config["dropout_rate"]))
         
         # Dense layers
@@ -193,28 +503,101 @@ class MarketPredictor:
         
         return model
     
-    async def _prepare_features(self, data: pd.DataFrame, token: str) -> pd.DataFrame:
-        """Prepare features for model training"""
+    async def _prepare_features(self, data: pd.DataFrame, token: str, persist: bool = False) -> pd.DataFrame:
+        """Prepare features for the model, reusing cached results for identical data.
+
+        Results are kept in an in-memory LRU. With persist=True (the training
+        path) the frame is also kept on disk, replacing the token's previous
+        file, so a restart retraining on the same history skips the work.
+        """
+        cache_key = self._feature_cache_key(data, token)
+        
+        features_df = self._feature_cache.get(cache_key)
+        if features_df is not None:
+            self._feature_cache.move_to_end(cache_key)
+            return features_df
+        
+        cache_path = os.path.join(FEATURE_CACHE_DIR, f"features_{cache_key}.parquet")
+        if persist and os.path.exists(cache_path):
+            try:
+                features_df = pd.read_parquet(cache_path).astype(np.float32, copy=False)
+            except Exception as e:
+                logger.warning(f"Could not read cached features for {token}: {e}")
+        
+        if features_df is None:
+            features_df = self._compute_features(data)
+            if persist:
+                self._persist_features(token, cache_path, features_df)
+        
+        self._feature_cache[cache_key] = features_df
+        if len(self._feature_cache) > FEATURE_CACHE_SIZE:
+            self._feature_cache.popitem(last=False)
+        
+        return features_df
+    
+    def _persist_features(self, token: str, cache_path: str, features_df: pd.DataFrame):
+        """Write a token's training features, evicting its older cached files"""
+        try:
+            os.makedirs(FEATURE_CACHE_DIR, exist_ok=True)
+            prefix = f"features_{token.lower()}_"
+            for name in os.listdir(FEATURE_CACHE_DIR):
+                if name.startswith(prefix) and name.endswith(".parquet"):
+                    os.remove(os.path.join(FEATURE_CACHE_DIR, name))
+            features_df.to_parquet(cache_path, compression='zstd')
+        except Exception as e:
+            logger.warning(f"Could not cache features for {token}: {e}")
+    
+    def _feature_cache_key(self, data: pd.DataFrame, token: str) -> str:
+        """Identify a price frame by token and a digest of its contents"""
+        row_hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+        digest = hashlib.sha1(row_hashes.tobytes()).hexdigest()[:16]
+        return f"{token.lower()}_{digest}"
+    
+    def _compute_features(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Build the model feature columns from raw OHLCV data"""
         features_df = data.copy()
         
         # Add technical indicators
         features_df = self.technical_indicators.add_all_indicators(features_df)
         
-        # Add time-based features
-        features_df['hour'] = pd.to_datetime(features_df['timestamp']).dt.hour
-        features_df['day_of_week'] = pd.to_datetime(features_df['timestamp']).dt.dayofweek
-        features_df['month'] = pd.to_datetime(features_df['timestamp']).dt.month
-        
-        # Add lag features
-        for lag in [1, 2, 3, 6, 12, 24]:
-            features_df[f'price_lag_{lag}'] = features_df['close'].shift(lag)
-            features_df[f'volume_lag_{lag}'] = features_df['volume'].shift(lag)
-        
-        # Add rolling statistics
-        for window in [7, 14, 30]:
-            features_df[f'price_mean_{window}'] = features_df['close'].rolling(window).mean()
-            features_df[f'price_std_{window}'] = features_df['close'].rolling(window).std()
-            features_df[f'volume_mean_{window}'] = features_df['volume'].rolling(window).mean()
+        # Add time-based features, parsing the timestamps once
+        timestamps = pd.DatetimeIndex(pd.to_datetime(price_timestamps(features_df)))
+        features_df['hour'] = timestamps.hour
+        features_df['day_of_week'] = timestamps.dayofweek
+        features_df['month'] = timestamps.month
+        
+        # Add lag features and rolling statistics, computed on the raw arrays
+        # and attached in one concat rather than one column at a time
+        close = features_df['close'].to_numpy(dtype=np.float64)
+        volume = features_df['volume'].to_numpy(dtype=np.float64)
+        n_rows = len(close)
+        
+        derived_columns = []
+        for lag in LAG_STEPS:
+            derived_columns += [f'price_lag_{lag}', f'volume_lag_{lag}']
+        for window in ROLLING_WINDOWS:
+            derived_columns += [f'price_mean_{window}', f'price_std_{window}', f'volume_mean_{window}']
+        derived = np.full((n_rows, len(derived_columns)), np.nan)
+        
+        col = 0
+        for lag in LAG_STEPS:
+            if lag < n_rows:
+                derived[lag:, col] = close[:-lag]
+                derived[lag:, col + 1] = volume[:-lag]
+            col += 2
+        for window in ROLLING_WINDOWS:
+            if window <= n_rows:
+                close_windows = np.lib.stride_tricks.sliding_window_view(close, window)
+                volume_windows = np.lib.stride_tricks.sliding_window_view(volume, window)
+                derived[window - 1:, col] = close_windows.mean(axis=1)
+                derived[window - 1:, col + 1] = close_windows.std(axis=1, ddof=1)
+                derived[window - 1:, col + 2] = volume_windows.mean(axis=1)
+            col += 3
+        
+        features_df = pd.concat(
+            [features_df, pd.DataFrame(derived, index=features_df.index, columns=derived_columns)],
+            axis=1
+        )
         
         # Drop NaN values
         features_df = features_df.dropna()
@@ -226,7 +609,8 @@ class MarketPredictor:
             'hour', 'day_of_week', 'month'
         ] + [col for col in features_df.columns if 'lag_' in col or 'mean_' in col or 'std_' in col]
         
-        return features_df[feature_columns]
+        # Keras runs in float32; cast once here instead of on every use
+        return features_df[feature_columns].astype(np.float32)
     
     def _create_sequences(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """Create sequences for LSTM training"""
@@ -235,13 +619,16 @@ class MarketPredictor:
         if len(data) < sequence_length + 1:
             return np.array([]), np.array([])
         
-        X, y = [], []
+        values = data.to_numpy(dtype=np.float32)
         
-        for i in range(sequence_length, len(data)):
-            X.append(data.iloc[i-sequence_length:i].values)
-            y.append(data['close'].iloc[i])
+        # Window i covers rows [i, i + sequence_length) and predicts the close
+        # of the following row; the strided view shares memory with values
+        X = np.lib.stride_tricks.sliding_window_view(
+            values, (sequence_length, values.shape[1])
+        )[:-1, 0]
+        y = values[sequence_length:, data.columns.get_loc('close')]
         
-        return np.array(X), np.array(y)
+        return X, y
     
     async def predict_prices(
         self, 
@@ -250,38 +637,42 @@ class MarketPredictor:
         horizon: int = 24
     ) -> Dict[str, List[Dict]]:
         """Predict prices for given tokens"""
-        predictions = {}
+        # Each token has its own model and scaler, so the rollouts cannot share
+        # one batched call; they run concurrently on the TF pool instead
+        results = await asyncio.gather(*(self._predict_one(token, horizon) for token in tokens))
+        
+        return {
+            token: token_predictions
+            for token, token_predictions in zip(tokens, results)
+            if token_predictions is not None
+        }
+    
+    async def _predict_one(self, token: str, horizon: int) -> Optional[List[Dict]]:
+        """Predict prices for one token, or None when it cannot be predicted"""
+        if not self._has_model(token):
+            logger.warning(f"No model available for {token}")
+            return None
         
-        for token in tokens:
-            if token not in self.models:
-                logger.warning(f"No model available for {token}")
-                continue
+        try:
+            # Get recent data
+            recent_data = await self.data_service.get_recent_price_data(token, hours=168)
             
-            try:
-                # Get recent data
-                recent_data = await self.data_service.get_recent_price_data(token, hours=168)
-                
-                if recent_data is None or len(recent_data) < self.config["sequence_length"]:
-                    logger.warning(f"Insufficient recent data for {token}")
-                    continue
-                
-                # Prepare features
-                features_df = await self._prepare_features(recent_data, token)
-                
-                if len(features_df) < self.config["sequence_length"]:
-                    continue
-                
-                # Make predictions
-                token_predictions = await self._predict_token_prices(
-                    token, features_df, horizon
-                )
-                
-                predictions[token] = token_predictions
-                
-            except Exception as e:
-                logger.error(f"Error predicting prices for {token}: {e}")
-        
-        return predictions
+            if recent_data is None or len(recent_data) < self.config["sequence_length"]:
+                logger.warning(f"Insufficient recent data for {token}")
+                return None
+            
+            # Prepare features
+            features_df = await self._prepare_features(recent_data, token)
+            
+            if len(features_df) < self.config["sequence_length"]:
+                return None
+            
+            # Make predictions
+            return await self._predict_token_prices(token, features_df, horizon)
+            
+        except Exception as e:
+            logger.error(f"Error predicting prices for {token}: {e}")
+            return None
     
     async def _predict_token_prices(
         self, 
@@ -290,41 +681,108 @@ class MarketPredictor:
         horizon: int
     ) -> List[Dict]:
         """Predict prices for a specific token"""
-        model = self.models[token]
-        scaler = self.scalers[token]
-        
         # Get the last sequence
-        last_sequence = features_df.tail(self.config["sequence_length"]).values
-        
-        # Scale the sequence
-        last_sequence_scaled = scaler.transform(
-            last_sequence.reshape(-1, last_sequence.shape[-1])
-        ).reshape(1, *last_sequence.shape)
+        last_sequence = features_df.tail(self.config["sequence_length"]).to_numpy(dtype=np.float32)
+        last_sequence = last_sequence[np.newaxis]
+        
+        # Run the rollout off the event loop so other tokens' I/O overlaps it
+        loop = asyncio.get_running_loop()
+        model = self.models.get(token)
+        interpreter = self.interpreters.get(token)
+        if isinstance(model, DummyPredictor):
+            # No scaling or TF dispatch for the fallback
+            preds = [float(model(last_sequence)[0, 0])] * horizon
+        elif interpreter is not None:
+            # Opt-in TFLite path (TFLITE_INFERENCE), stepped from Python
+            preds = await loop.run_in_executor(
+                self._tf_pool, self._rollout_tflite, interpreter, self.scalers[token], last_sequence, horizon
+            )
+        else:
+            # Default path: the whole rollout runs in one graph call, which
+            # applies the scaling itself
+            preds = await loop.run_in_executor(
+                self._tf_pool, self._rollout_graph, token, last_sequence, horizon
+            )
         
         predictions = []
-        current_sequence = last_sequence_scaled.copy()
-        
-        for i in range(horizon):
-            # Predict next price
-            pred = model.predict(current_sequence, verbose=0)[0][0]
-            
-            # Create prediction entry
-            timestamp = datetime.now() + timedelta(hours=i+1)
+        now = datetime.now()
+        for i, pred in enumerate(preds):
+            timestamp = now + timedelta(hours=i+1)
             predictions.append({
                 "timestamp": timestamp.isoformat(),
-                "predicted_price": float(pred),
+                "predicted_price": pred,
                 "confidence": self._calculate_confidence(i, horizon)
             })
+        
+        return predictions
+    
+    def _rollout_tflite(
+        self,
+        interpreter: TFLitePredictor,
+        scaling: Tuple[np.ndarray, ...],
+        sequence: np.ndarray,
+        horizon: int
+    ) -> List[float]:
+        """Autoregressive rollout through the TFLite interpreter, from an unscaled window.
+
+        The window lives in a mirrored ring buffer (every row stored twice,
+        seq_len apart), so each step writes one row and the next window is a
+        contiguous view; nothing is shifted or reallocated per step.
+        """
+        # Same affine maps as scaler.transform / y_scaler.inverse_transform
+        scale, offset, y_scale, y_offset = scaling
+        sequence = sequence * scale + offset
+        seq_len, n_features = sequence.shape[1], sequence.shape[2]
+        ring = np.empty((2 * seq_len, n_features), dtype=np.float32)
+        ring[:seq_len] = sequence[0]
+        ring[seq_len:] = sequence[0]
+        start = 0
+        preds = []
+        
+        for _ in range(horizon):
+            window = ring[start:start + seq_len]
+            pred = (float(interpreter(window[np.newaxis])[0, 0]) - y_offset[0]) / y_scale[0]
+            preds.append(float(pred))
             
             # Update sequence for next prediction (simplified)
             # In practice, you'd want to update with actual features
-            new_row = current_sequence[0, -1:].copy()
-            new_row[0, 3] = pred  # Update close price
-            current_sequence = np.concatenate([
-                current_sequence[:, 1:], new_row.reshape(1, 1, -1)
-            ], axis=1)
+            ring[start] = window[-1]
+            ring[start, CLOSE_INDEX] = pred * scale[CLOSE_INDEX] + offset[CLOSE_INDEX]
+            ring[start + seq_len] = ring[start]
+            start = (start + 1) % seq_len
         
-        return predictions
+        return preds
+    
+    def _rollout_graph(self, token: str, sequence: np.ndarray, horizon: int) -> List[float]:
+        """Autoregressive rollout through the compiled Keras graph, from an unscaled window"""
+        rollout = self._get_rollout(token)
+        preds = rollout(
+            tf.convert_to_tensor(sequence, dtype=tf.float32),
+            tf.constant(horizon, dtype=tf.int32)
+        )
+        return preds[0].numpy().tolist()
+    
+    def _get_rollout(self, token: str):
+        """Return the token's compiled rollout, building it on first use"""
+        rollout = self._rollouts.get(token)
+        if rollout is None:
+            model = self.models[token]
+            rollout = build_rollout(
+                model, self.config["sequence_length"], model.input_shape[-1], self.scalers[token]
+            )
+            self._rollouts[token] = rollout
+        return rollout
+    
+    def _export_rollout(self, token: str):
+        """Save the traced rollout as a SavedModel so restarts skip retracing"""
+        model = self.models[token]
+        module = tf.Module()
+        module.model = model
+        module.forecast = build_rollout(
+            model, self.config["sequence_length"], model.input_shape[-1], self.scalers[token]
+        )
+        tf.saved_model.save(module, self._saved_model_path(token))
+        self._rollouts[token] = module.forecast
     
     def _calculate_confidence(self, step: int, horizon: int) -> float:
         """Calculate confidence score for prediction"""
@@ -339,7 +797,7 @@ class MarketPredictor:
         confidence_scores = {}
         
         for token in tokens:
-            if token in self.models:
+            if self._has_model(token):
                 # Calculate confidence based on recent prediction accuracy
                 confidence_scores[token] = await self._calculate_model_confidence(token)
             else:
@@ -353,12 +811,25 @@ class MarketPredictor:
             # Get recent data for validation
             recent_data = await self.data_service.get_recent_price_data(token, hours=48)
             
-            if recent_data is None or len(recent_data) < 24:
+            if recent_data is None or len(recent_data) < CONFIDENCE_WINDOW:
                 return 0.5  # Default confidence
             
-            # Calculate recent prediction accuracy (simplified)
-            actual_prices = recent_data['close'].tail(24).values
-            price_volatility = np.std(actual_prices) / np.mean(actual_prices)
+            # Calculate recent prediction accuracy (simplified), feeding only
+            # the prices that arrived since the last call into the window
+            timestamps = price_timestamps(recent_data)
+            state = self._volatility.get(token)
+            if state is None:
+                new_rows = recent_data.tail(CONFIDENCE_WINDOW)
+            else:
+                new_rows = recent_data[(timestamps > state.last_timestamp).to_numpy()]
+            if state is None or len(new_rows) >= CONFIDENCE_WINDOW:
+                state = self._volatility[token] = RollingVolatility(CONFIDENCE_WINDOW)
+                new_rows = new_rows.tail(CONFIDENCE_WINDOW)
+            
+            for price in new_rows['close'].to_numpy():
+                state.push(price)
+            state.last_timestamp = timestamps.iloc[-1]
+            price_volatility = state.volatility
             
             # Higher volatility = lower confidence
             confidence = max(0.1, min(0.9, 1.0 - price_volatility * 2))
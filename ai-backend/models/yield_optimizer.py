@@ -4,9 +4,10 @@ import tensorflow as tf
 from tensorflow.keras.models import Sequential, Model, load_model
 from tensorflow.keras.layers import Dense, Dropout, BatchNormalization, Input, Concatenate
 from tensorflow.keras.optimizers import Adam
+from tensorflow.keras import mixed_precision
 from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
 from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
 from sklearn.model_selection import train_test_split
 import joblib
 import asyncio
@@ -14,17 +15,114 @@ from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
 import logging
 
-from config import MODEL_CONFIG, settings
+from config import MODEL_CONFIG, MAX_POSITION_SIZE, RISK_FREE_RATE
 from services.data_service import DataService
 from utils.risk_calculator import RiskCalculator
 
 logger = logging.getLogger(__name__)
 
+# Hidden layers run in float16 on GPUs (tensor cores); outputs stay float32.
+# Set per layer rather than globally so the price LSTMs are unaffected.
+LAYER_POLICY = 'mixed_float16' if tf.config.list_physical_devices('GPU') else 'float32'
+
+# Live protocol fields fed to the models, in training column order, with the
+# value used when a protocol does not report the field
+PROTOCOL_FEATURE_KEYS = (
+    'apy', 'tvl', 'volume_24h', 'market_cap', 'liquidity_depth',
+    'price_volatility_30d', 'tvl_change_7d', 'apy_volatility',
+    'volume_to_tvl_ratio', 'protocol_age_days', 'market_cap_rank',
+    'relative_apy', 'audit_score', 'liquidity_score', 'volatility_score'
+)
+PROTOCOL_FEATURE_DEFAULTS = (0, 0, 0, 0, 0, 0, 0, 0.1, 0, 365, 100, 0, 5, 0, 0.1)
+
+def grouped_rolling_std(values: np.ndarray, groups: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample std over `window` rows within each group, in row order.
+
+    Equivalent to groupby(groups).rolling(window).std() but computed with one
+    strided pass over the group-sorted values; rows with a negative group code
+    (missing group) get NaN.
+    """
+    n_rows = len(values)
+    order = np.argsort(groups, kind='stable')
+    sorted_values = values[order].astype(np.float64)
+    sorted_groups = groups[order]
+    
+    # Position of each row within its group
+    group_starts = np.r_[True, sorted_groups[1:] != sorted_groups[:-1]] if n_rows else np.array([], dtype=bool)
+    row_numbers = np.arange(n_rows)
+    position = row_numbers - np.maximum.accumulate(np.where(group_starts, row_numbers, 0))
+    
+    sorted_std = np.full(n_rows, np.nan)
+    if n_rows >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(sorted_values, window)
+        sorted_std[window - 1:] = windows.std(axis=1, ddof=1)
+    # Windows that reach back into the previous group
+    sorted_std[(position < window - 1) | (sorted_groups < 0)] = np.nan
+    
+    result = np.empty(n_rows)
+    result[order] = sorted_std
+    return result
+
+def fold_batch_norm(model):
+    """Inference copy of a Dense/BatchNormalization/Dropout stack with only Dense layers.
+
+    BatchNormalization here follows the activation, so it is folded forward
+    into the next Dense: for BN(h) = h * scale + shift, the next layer's
+    kernel becomes scale[:, None] * W and its bias shift @ W + b. Dropout is
+    the identity at inference. Other layer types are left alone.
+    """
+    fused_layers = [Input(shape=(model.input_shape[-1],))]
+    fused_weights = []
+    scale, shift = None, None
+    
+    for layer in model.layers:
+        if isinstance(layer, Dense):
+            kernel, bias = [w.astype(np.float32) for w in layer.get_weights()]
+            if scale is not None:
+                bias = shift @ kernel + bias
+                kernel = scale[:, None] * kernel
+                scale, shift = None, None
+            fused_layers.append(Dense(layer.units, activation=layer.activation))
+            fused_weights += [kernel, bias]
+        elif isinstance(layer, BatchNormalization):
+            if scale is not None:
+                return model
+            mean = layer.moving_mean.numpy().astype(np.float32)
+            variance = layer.moving_variance.numpy().astype(np.float32)
+            gamma = layer.gamma.numpy().astype(np.float32) if layer.scale else np.ones_like(mean)
+            beta = layer.beta.numpy().astype(np.float32) if layer.center else np.zeros_like(mean)
+            scale = gamma / np.sqrt(variance + layer.epsilon)
+            shift = beta - mean * scale
+        elif not isinstance(layer, (Dropout, tf.keras.layers.InputLayer)):
+            return model
+    
+    if scale is not None:
+        return model
+    
+    fused = Sequential(fused_layers)
+    fused.set_weights(fused_weights)
+    return fused
+
+def build_inference_fn(model):
+    """Trace the model once for (batch, features) float32 input and compile it
+    with XLA, fusing each Dense and its activation into one kernel"""
+    @tf.function(
+        jit_compile=True,
+        input_signature=[tf.TensorSpec([None, model.input_shape[-1]], tf.float32)]
+    )
+    def infer(features):
+        return model(features, training=False)
+    
+    return infer
+
 class YieldOptimizer:
     def __init__(self):
         self.allocation_model = None
         self.risk_model = None
         self.yield_predictor = None
+        self._allocation_fn = None
+        self._yield_fn = None
+        self._feature_scaling = None
         self.scalers = {}
         self.encoders = {}
         self.is_initialized = False
@@ -50,9 +148,9 @@ class YieldOptimizer:
         """Load existing models or train new ones"""
         try:
             # Try to load existing models
-            allocation_model_path = "./models/allocation_optimizer.h5"
+            allocation_model_path = self._keras_model_path("allocation_optimizer")
             risk_model_path = "./models/risk_predictor.pkl"
-            yield_model_path = "./models/yield_predictor.h5"
+            yield_model_path = self._keras_model_path("yield_predictor")
             
             if self._models_exist([allocation_model_path, risk_model_path, yield_model_path]):
                 self.allocation_model = load_model(allocation_model_path)
@@ -60,8 +158,12 @@ class YieldOptimizer:
                 self.yield_predictor = load_model(yield_model_path)
                 
                 # Load scalers and encoders
-                self.scalers = joblib.load("./models/yield_scalers.pkl")
-                self.encoders = joblib.load("./models/yield_encoders.pkl")
+                self.scalers = joblib.load("./models/yield_scalers.pkl", mmap_mode='r')
+                self.encoders = {
+                    # Older saves hold fitted LabelEncoders
+                    feature: pd.Index(encoder.classes_) if isinstance(encoder, LabelEncoder) else encoder
+                    for feature, encoder in joblib.load("./models/yield_encoders.pkl").items()
+                }
                 
                 logger.info("Loaded existing yield optimization models")
             else:
@@ -72,6 +174,28 @@ class YieldOptimizer:
         except Exception as e:
             logger.error(f"Error loading/training yield models: {e}")
             await self._create_dummy_models()
+        
+        # Serve BatchNormalization-free copies; the saved models are untouched
+        self.allocation_model = fold_batch_norm(self.allocation_model)
+        self.yield_predictor = fold_batch_norm(self.yield_predictor)
+        self._allocation_fn = build_inference_fn(self.allocation_model)
+        self._yield_fn = build_inference_fn(self.yield_predictor)
+        
+        # float32 (mean, scale) of the fitted feature scaler for request-time scaling
+        if 'features' in self.scalers:
+            feature_scaler = self.scalers['features']
+            self._feature_scaling = (
+                feature_scaler.mean_.astype(np.float32),
+                feature_scaler.scale_.astype(np.float32)
+            )
+    
+    def _keras_model_path(self, name: str) -> str:
+        """Path of a saved Keras model, falling back to a legacy .h5 file"""
+        import os
+        legacy_path = f"./models/{name}.h5"
+        if not os.path.exists(f"./models/{name}.keras") and os.path.exists(legacy_path):
+            return legacy_path
+        return f"./models/{name}.keras"
     
     def _models_exist(self, model_paths: List[str]) -> bool:
         """Check if all model files exist"""
@@ -105,40 +229,54 @@ class YieldOptimizer:
         await self._train_yield_model(X, y_yield)
         
         # Save models
-        self.allocation_model.save("./models/allocation_optimizer.h5")
-        joblib.dump(self.risk_model, "./models/risk_predictor.pkl")
-        self.yield_predictor.save("./models/yield_predictor.h5")
+        self.allocation_model.save("./models/allocation_optimizer.keras")
+        # lz4 keeps the tree ensemble small on disk while decompressing quickly;
+        # the small scaler dict stays uncompressed so it can be memory-mapped
+        joblib.dump(self.risk_model, "./models/risk_predictor.pkl", compress=('lz4', 3))
+        self.yield_predictor.save("./models/yield_predictor.keras")
         joblib.dump(self.scalers, "./models/yield_scalers.pkl")
         joblib.dump(self.encoders, "./models/yield_encoders.pkl")
     
     async def _prepare_training_data(self, protocol_data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Prepare training data for all models"""
-        # Feature engineering
-        features_df = protocol_data.copy()
+        # Feature engineering on a shallow copy: the base columns are shared with
+        # protocol_data and only the added/replaced columns are allocated
+        features_df = protocol_data.copy(deep=False)
+        
+        # Parse the date columns once; a no-op when they are already datetimes
+        for column in ('timestamp', 'launch_date'):
+            features_df[column] = pd.to_datetime(features_df[column], cache=True, utc=True)
         
         # Add protocol features
         features_df['tvl_change_7d'] = features_df.groupby('protocol')['tvl'].pct_change(7)
-        features_df['apy_volatility'] = features_df.groupby('protocol')['apy'].rolling(30).std().reset_index(0, drop=True)
-        features_df['volume_to_tvl_ratio'] = features_df['volume_24h'] / features_df['tvl']
-        features_df['protocol_age_days'] = (pd.to_datetime(features_df['timestamp']) - pd.to_datetime(features_df['launch_date'])).dt.days
+        features_df['apy_volatility'] = grouped_rolling_std(
+            features_df['apy'].to_numpy(), pd.factorize(features_df['protocol'])[0], 30
+        )
+        features_df['protocol_age_days'] = (features_df['timestamp'] - features_df['launch_date']).dt.days.astype(np.float32)
         
         # Add market features
         features_df['market_cap_rank'] = features_df.groupby('timestamp')['market_cap'].rank(ascending=False)
         features_df['relative_apy'] = features_df.groupby('timestamp')['apy'].transform(lambda x: (x - x.mean()) / x.std())
         
-        # Add risk features
-        features_df['audit_score'] = features_df['audit_count'] * features_df['audit_quality']
-        features_df['liquidity_score'] = np.log1p(features_df['liquidity_depth'])
-        features_df['volatility_score'] = features_df['price_volatility_30d'] * features_df['apy_volatility']
+        # Add ratio and risk features in one evaluation (numexpr when installed)
+        features_df.eval(
+            """
+            volume_to_tvl_ratio = volume_24h / tvl
+            audit_score = audit_count * audit_quality
+            liquidity_score = log1p(liquidity_depth)
+            volatility_score = price_volatility_30d * apy_volatility
+            """,
+            inplace=True
+        )
         
         # Encode categorical features
         categorical_features = ['protocol', 'blockchain', 'category']
         for feature in categorical_features:
+            labels = features_df[feature].astype(str)
             if feature not in self.encoders:
-                self.encoders[feature] = LabelEncoder()
-                features_df[f'{feature}_encoded'] = self.encoders[feature].fit_transform(features_df[feature].astype(str))
-            else:
-                features_df[f'{feature}_encoded'] = self.encoders[feature].transform(features_df[feature].astype(str))
+                # Sorted categories give the same codes LabelEncoder did
+                self.encoders[feature] = pd.Index(np.sort(labels.unique()))
+            features_df[f'{feature}_encoded'] = self.encoders[feature].get_indexer(labels)
         
         # Select features
         feature_columns = [
@@ -154,12 +292,13 @@ class YieldOptimizer:
         if len(features_df) == 0:
             return np.array([]), np.array([]), np.array([]), np.array([])
         
-        # Scale features
+        # Scale features (float32 in, float32 out; the networks run in float32)
+        X_raw = features_df[feature_columns].to_numpy(dtype=np.float32)
         if 'features' not in self.scalers:
             self.scalers['features'] = StandardScaler()
-            X = self.scalers['features'].fit_transform(features_df[feature_columns])
+            X = self.scalers['features'].fit_transform(X_raw)
         else:
-            X = self.scalers['features'].transform(features_df[feature_columns])
+            X = self.scalers['features'].transform(X_raw)
         
         # Prepare targets
         y_allocation = self._calculate_optimal_allocations(features_df)
@@ -171,33 +310,25 @@ class YieldOptimizer:
     def _calculate_optimal_allocations(self, data: pd.DataFrame) -> np.ndarray:
         """Calculate optimal allocations based on risk-adjusted returns"""
         # Calculate Sharpe ratio for each protocol
-        data['sharpe_ratio'] = (data['apy'] - settings.RISK_FREE_RATE) / data['apy_volatility']
+        data['sharpe_ratio'] = (data['apy'] - RISK_FREE_RATE) / data['apy_volatility']
         
-        # Group by timestamp and calculate optimal weights
-        allocations = []
+        # Inverse volatility weighting within each timestamp (simplified
+        # mean-variance optimization); timestamps with a single protocol are skipped
+        group_size = data.groupby('timestamp')['timestamp'].transform('size')
+        group = data.loc[group_size >= 2]
+        timestamps = group['timestamp']
         
-        for timestamp, group in data.groupby('timestamp'):
-            if len(group) < 2:
-                continue
-            
-            # Use mean-variance optimization (simplified)
-            returns = group['apy'].values
-            risks = group['apy_volatility'].values
-            
-            # Avoid division by zero
-            risks = np.where(risks == 0, 0.01, risks)
-            
-            # Calculate weights using inverse volatility weighting
-            inv_vol_weights = 1 / risks
-            weights = inv_vol_weights / inv_vol_weights.sum()
-            
-            # Apply constraints
-            weights = np.clip(weights, 0, settings.MAX_POSITION_SIZE)
-            weights = weights / weights.sum()  # Renormalize
-            
-            allocations.extend(weights)
+        # Avoid division by zero
+        risks = group['apy_volatility'].mask(group['apy_volatility'] == 0, 0.01)
+        
+        inv_vol_weights = 1 / risks
+        weights = inv_vol_weights / inv_vol_weights.groupby(timestamps).transform('sum')
+        
+        # Apply constraints
+        weights = weights.clip(0, MAX_POSITION_SIZE)
+        weights = weights / weights.groupby(timestamps).transform('sum')  # Renormalize
         
-        return np.array(allocations)
+        return weights.to_numpy()
     
     async def _train_allocation_model(self, X: np.ndarray, y: np.ndarray):
         """Train the allocation optimization model"""
@@ -233,31 +364,31 @@ class YieldOptimizer:
         inputs = Input(shape=(input_dim,))
         
         # Hidden layers
-        x = Dense(self.config["hidden_layers"][0], activation=self.config["activation"])(inputs)
-        x = BatchNormalization()(x)
-        x = Dropout(self.config["dropout_rate"])(x)
+        x = Dense(self.config["hidden_layers"][0], activation=self.config["activation"], dtype=LAYER_POLICY)(inputs)
+        x = BatchNormalization(dtype=LAYER_POLICY)(x)
+        x = Dropout(self.config["dropout_rate"], dtype=LAYER_POLICY)(x)
         
-        x = Dense(self.config["hidden_layers"][1], activation=self.config["activation"])(x)
-        x = BatchNormalization()(x)
-        x = Dropout(self.config["dropout_rate"])(x)
+        x = Dense(self.config["hidden_layers"][1], activation=self.config["activation"], dtype=LAYER_POLICY)(x)
+        x = BatchNormalization(dtype=LAYER_POLICY)(x)
+        x = Dropout(self.config["dropout_rate"], dtype=LAYER_POLICY)(x)
         
-        x = Dense(self.config["hidden_layers"][2], activation=self.config["activation"])(x)
-        x = Dropout(self.config["dropout_rate"] / 2)(x)
+        x = Dense(self.config["hidden_layers"][2], activation=self.config["activation"], dtype=LAYER_POLICY)(x)
+        x = Dropout(self.config["dropout_rate"] / 2, dtype=LAYER_POLICY)(x)
         
         # Output layer (allocation weights)
-        outputs = Dense(1, activation='sigmoid')(x)  # Single allocation weight
+        outputs = Dense(1, activation='sigmoid', dtype='float32')(x)  # Single allocation weight
         
         model = Model(inputs=inputs, outputs=outputs)
         
-        optimizer = Adam(learning_rate=self.config["learning_rate"])
+        optimizer = self._build_optimizer()
         model.compile(optimizer=optimizer, loss='mse', metrics=['mae'])
         
         return model
     
     async def _train_risk_model(self, X: np.ndarray, y: np.ndarray):
-        """Train the risk prediction model using Random Forest"""
+        """Train the risk prediction model using histogram gradient boosting"""
         if len(X) == 0 or len(y) == 0:
-            self.risk_model = RandomForestRegressor(n_estimators=10, random_state=42)
+            self.risk_model = HistGradientBoostingRegressor(max_iter=10, random_state=42)
             # Fit with dummy data
             dummy_X = np.random.randn(100, X.shape[1] if len(X) > 0 else 10)
             dummy_y = np.random.randn(100)
@@ -267,12 +398,14 @@ class YieldOptimizer:
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
-        # Train Random Forest model
-        self.risk_model = RandomForestRegressor(
-            n_estimators=100,
-            max_depth=10,
-            min_samples_split=5,
+        # Train histogram gradient boosting model (pre-binned features, fast fit/predict;
+        # fit and predict already use every core through OpenMP, no n_jobs needed)
+        self.risk_model = HistGradientBoostingRegressor(
+            max_iter=200,
+            max_depth=8,
+            learning_rate=0.05,
             min_samples_leaf=2,
+            early_stopping=True,
             random_state=42
         )
         
@@ -323,25 +456,32 @@ class YieldOptimizer:
     def _build_yield_model(self, input_dim: int) -> Sequential:
         """Build yield prediction neural network"""
         model = Sequential([
-            Dense(self.config["hidden_layers"][0], activation=self.config["activation"], input_shape=(input_dim,)),
-            BatchNormalization(),
-            Dropout(self.config["dropout_rate"]),
+            Dense(self.config["hidden_layers"][0], activation=self.config["activation"], input_shape=(input_dim,), dtype=LAYER_POLICY),
+            BatchNormalization(dtype=LAYER_POLICY),
+            Dropout(self.config["dropout_rate"], dtype=LAYER_POLICY),
             
-            Dense(self.config["hidden_layers"][1], activation=self.config["activation"]),
-            BatchNormalization(),
-            Dropout(self.config["dropout_rate"]),
+            Dense(self.config["hidden_layers"][1], activation=self.config["activation"], dtype=LAYER_POLICY),
+            BatchNormalization(dtype=LAYER_POLICY),
+            Dropout(self.config["dropout_rate"], dtype=LAYER_POLICY),
             
-            Dense(self.config["hidden_layers"][2], activation=self.config["activation"]),
-            Dropout(self.config["dropout_rate"] / 2),
+            Dense(self.config["hidden_layers"][2], activation=self.config["activation"], dtype=LAYER_POLICY),
+            Dropout(self.config["dropout_rate"] / 2, dtype=LAYER_POLICY),
             
-            Dense(1)  # Yield prediction
+            Dense(1, dtype='float32')  # Yield prediction
         ])
         
-        optimizer = Adam(learning_rate=self.config["learning_rate"])
+        optimizer = self._build_optimizer()
         model.compile(optimizer=optimizer, loss='mse', metrics=['mae'])
         
         return model
     
+    def _build_optimizer(self) -> Adam:
+        """Adam optimizer, with dynamic loss scaling when layers run in float16"""
+        optimizer = Adam(learning_rate=self.config["learning_rate"])
+        if LAYER_POLICY == 'mixed_float16':
+            optimizer = mixed_precision.LossScaleOptimizer(optimizer)
+        return optimizer
+    
     async def _create_dummy_models(self):
         """Create dummy models when insufficient data"""
         input_dim = 15  # Default feature dimension
@@ -372,7 +512,7 @@ class YieldOptimizer:
     
     def _create_dummy_risk_model(self, input_dim: int):
         """Create dummy risk model"""
-        self.risk_model = RandomForestRegressor(n_estimators=10, random_state=42)
+        self.risk_model = HistGradientBoostingRegressor(max_iter=10, random_state=42)
         dummy_X = np.random.randn(100, input_dim)
         dummy_y = np.random.randn(100)
         self.risk_model.fit(dummy_X, dummy_y)
@@ -401,35 +541,31 @@ class YieldOptimizer:
             if not protocol_data:
                 return self._get_default_optimization(protocols, portfolio_value)
             
-            # Prepare features for each protocol
+            # Prepare features for each protocol as one (N, D) batch
+            present = [protocol for protocol in protocols if protocol in protocol_data]
             optimizations = []
             
-            for protocol in protocols:
-                if protocol not in protocol_data:
-                    continue
-                
-                features = await self._prepare_protocol_features(protocol_data[protocol])
-                
-                # Predict allocation weight
-                allocation_weight = self.allocation_model.predict(features.reshape(1, -1))[0][0]
-                
-                # Predict risk
-                risk_score = self.risk_model.predict(features.reshape(1, -1))[0]
+            if present:
+                features = self._prepare_protocol_feature_matrix(
+                    [protocol_data[protocol] for protocol in present]
+                )
                 
-                # Predict yield
-                yield_pred = self.yield_predictor.predict(features.reshape(1, -1))[0][0]
+                # Run the models off the event loop so other requests keep being served
+                allocation_weights, risk_scores, yield_preds = await asyncio.to_thread(
+                    self._predict_protocols, features
+                )
                 
-                # Unscale yield prediction
-                if 'yield' in self.scalers:
-                    yield_pred = self.scalers['yield'].inverse_transform([[yield_pred]])[0][0]
-                
-                optimizations.append({
-                    'protocol': protocol,
-                    'allocation_weight': float(allocation_weight),
-                    'risk_score': float(risk_score),
-                    'predicted_apy': float(yield_pred),
-                    'current_allocation': current_positions.get(protocol, 0.0)
-                })
+                optimizations = [
+                    {
+                        'protocol': protocol,
+                        'allocation_weight': float(allocation_weight),
+                        'risk_score': float(risk_score),
+                        'predicted_apy': float(yield_pred),
+                        'current_allocation': current_positions.get(protocol, 0.0)
+                    }
+                    for protocol, allocation_weight, risk_score, yield_pred
+                    in zip(present, allocation_weights, risk_scores, yield_preds)
+                ]
             
             # Apply risk tolerance adjustments
             optimizations = self._apply_risk_tolerance(optimizations, risk_tolerance)
@@ -458,35 +594,41 @@ class YieldOptimizer:
             logger.error(f"Error optimizing allocation: {e}")
             return self._get_default_optimization(protocols, portfolio_value)
     
-    async def _prepare_protocol_features(self, protocol_data: Dict) -> np.ndarray:
+    def _predict_protocols(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Predict allocation weight, risk and yield with one call per model"""
+        features_tensor = tf.constant(features)
+        allocation_weights = self._allocation_fn(features_tensor).numpy().ravel()
+        # Both the training and request matrices are float32 already; the
+        # boosted trees bin their input, so there is no per-dtype fast path to hit
+        risk_scores = self.risk_model.predict(features)
+        yield_preds = self._yield_fn(features_tensor).numpy().ravel()
+        
+        # Unscale yield predictions
+        if 'yield' in self.scalers:
+            yield_preds = self.scalers['yield'].inverse_transform(yield_preds.reshape(-1, 1)).ravel()
+        
+        return allocation_weights, risk_scores, yield_preds
+    
+    def _prepare_protocol_features(self, protocol_data: Dict) -> np.ndarray:
         """Prepare features for a single protocol"""
-        # Extract features from protocol data
-        features = [
-            protocol_data.get('apy', 0),
-            protocol_data.get('tvl', 0),
-            protocol_data.get('volume_24h', 0),
-            protocol_data.get('market_cap', 0),
-            protocol_data.get('liquidity_depth', 0),
-            protocol_data.get('price_volatility_30d', 0),
-            protocol_data.get('tvl_change_7d', 0),
-            protocol_data.get('apy_volatility', 0.1),
-            protocol_data.get('volume_to_tvl_ratio', 0),
-            protocol_data.get('protocol_age_days', 365),
-            protocol_data.get('market_cap_rank', 100),
-            protocol_data.get('relative_apy', 0),
-            protocol_data.get('audit_score', 5),
-            protocol_data.get('liquidity_score', 0),
-            protocol_data.get('volatility_score', 0.1)
-        ]
+        return self._prepare_protocol_feature_matrix([protocol_data])[0]
+    
+    def _prepare_protocol_feature_matrix(self, protocols_data: List[Dict]) -> np.ndarray:
+        """Prepare an (N, D) feature matrix for several protocols with one scaler call"""
+        features = np.array(
+            [
+                [data.get(key, default) for key, default in zip(PROTOCOL_FEATURE_KEYS, PROTOCOL_FEATURE_DEFAULTS)]
+                for data in protocols_data
+            ],
+            dtype=np.float32
+        ).reshape(len(protocols_data), len(PROTOCOL_FEATURE_KEYS))
         
-        # Scale features
-        features_array = np.array(features).reshape(1, -1)
-        if 'features' in self.scalers:
-            features_scaled = self.scalers['features'].transform(features_array)
-        else:
-            features_scaled = features_array
+        # Scale features; same result as StandardScaler.transform without its checks
+        if self._feature_scaling is not None:
+            mean, scale = self._feature_scaling
+            features = (features - mean) / scale
         
-        return features_scaled.flatten()
+        return features
     
     def _apply_risk_tolerance(self, optimizations: List[Dict], risk_tolerance: str) -> List[Dict]:
         """Apply risk tolerance to allocations"""
@@ -510,25 +652,21 @@ class YieldOptimizer:
         if not optimizations:
             return 0.5
         
-        weighted_risk = sum(
-            opt['allocation_weight'] * opt['risk_score'] 
-            for opt in optimizations
-        )
+        count = len(optimizations)
+        weights = np.fromiter((opt['allocation_weight'] for opt in optimizations), dtype=np.float64, count=count)
+        risks = np.fromiter((opt['risk_score'] for opt in optimizations), dtype=np.float64, count=count)
         
-        return min(1.0, max(0.0, weighted_risk))
+        return float(np.clip(np.dot(weights, risks), 0.0, 1.0))
     
     def _check_rebalancing_needed(self, optimizations: List[Dict]) -> bool:
         """Check if portfolio rebalancing is needed"""
         threshold = 0.05  # 5% threshold
         
-        for opt in optimizations:
-            current = opt['current_allocation']
-            target = opt['allocation_weight']
-            
-            if abs(current - target) > threshold:
-                return True
+        count = len(optimizations)
+        current = np.fromiter((opt['current_allocation'] for opt in optimizations), dtype=np.float64, count=count)
+        target = np.fromiter((opt['allocation_weight'] for opt in optimizations), dtype=np.float64, count=count)
         
-        return False
+        return bool(np.any(np.abs(current - target) > threshold))
     
     def _get_default_optimization(self, protocols: List[str], portfolio_value: float) -> Dict:
         """Get default optimization when models fail"""
@@ -657,24 +795,25 @@ class YieldOptimizer:
         if not positions:
             return {'overall_risk': 0.5, 'risk_factors': []}
         
-        risk_factors = []
-        total_risk = 0
-        total_weight = 0
+        # Position weights computed once instead of re-summing per position
+        values = np.fromiter((pos['value'] for pos in positions), dtype=np.float64, count=len(positions))
+        total_value = values.sum()
+        if total_value <= 0:
+            return {'overall_risk': 0.5, 'risk_factors': []}
+        weights = values / total_value
+        risks = np.fromiter((pos.get('risk_score', 0.5) for pos in positions), dtype=np.float64, count=len(positions))
         
-        for pos in positions:
-            weight = pos['value'] / sum(p['value'] for p in positions)
-            protocol_risk = pos.get('risk_score', 0.5)
-            
-            total_risk += weight * protocol_risk
-            total_weight += weight
-            
-            if protocol_risk > 0.7:
-                risk_factors.append(f"High risk in {pos.get('protocol', 'unknown')} protocol")
+        risk_factors = [
+            f"High risk in {pos.get('protocol', 'unknown')} protocol"
+            for pos, protocol_risk in zip(positions, risks)
+            if protocol_risk > 0.7
+        ]
         
-        overall_risk = total_risk / total_weight if total_weight > 0 else 0.5
+        total_weight = weights.sum()
+        overall_risk = float(np.dot(weights, risks) / total_weight) if total_weight > 0 else 0.5
         
         # Add concentration risk factor
-        max_allocation = max(pos['value'] / sum(p['value'] for p in positions) for pos in positions)
+        max_allocation = float(weights.max())
         if max_allocation > 0.3:
             risk_factors.append(f"Concentration risk: {max_allocation:.1%} in single protocol")
         
@@ -696,15 +835,16 @@ class YieldOptimizer:
             return {'total_return': 0, 'apy': 0, 'sharpe_ratio': 0}
         
         # Estimate metrics based on current positions
+        total_value = sum(pos['value'] for pos in positions)
         weighted_apy = sum(
-            pos.get('apy', 5.0) * pos['value'] / sum(p['value'] for p in positions)
+            pos.get('apy', 5.0) * pos['value'] / total_value
             for pos in positions
         )
         
         return {
             'estimated_apy': weighted_apy,
             'total_return': portfolio_data.get('total_return', 0),
-            'sharpe_ratio': max(0, (weighted_apy - settings.RISK_FREE_RATE) / 10),  # Simplified
+            'sharpe_ratio': max(0, (weighted_apy - RISK_FREE_RATE) / 10),  # Simplified
             'volatility': sum(pos.get('volatility', 0.1) for pos in positions) / len(positions)
         }
     
@@ -0,0 +1,17 @@
+"""Download the local chat model into the HuggingFace cache.
+
+Run once at image build time so workers load the weights from disk instead of
+downloading them on the first chat request:
+
+    python preload.py
+"""
+import logging
+
+from main_simple import LOCAL_CHAT_MODEL, load_ai_generator
+
+logger = logging.getLogger(__name__)
+
+if __name__ == "__main__":
+    if load_ai_generator() is None:
+        raise SystemExit(f"Failed to preload {LOCAL_CHAT_MODEL}")
+    logger.info(f"Cached {LOCAL_CHAT_MODEL}")
@@ -1,30 +1,113 @@
 import asyncio
+import os
 import aiohttp
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import logging
-import json
+import heapq
+import itertools
+import orjson
+import msgpack
+from collections import deque
 from dataclasses import dataclass, asdict
 from concurrent.futures import ThreadPoolExecutor
 import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import text
+from sqlalchemy.engine import make_url
 import ccxt.async_support as ccxt
 import yfinance as yf
-from web3 import Web3
-from web3.middleware import geth_poa_middleware
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3.middleware import async_geth_poa_middleware
 import time
 from pathlib import Path
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from aiolimiter import AsyncLimiter
 
-from config import settings, DATA_COLLECTION_INTERVALS
+from config import settings, DATA_COLLECTION_INTERVALS, SUPPORTED_TOKENS, SUPPORTED_PROTOCOLS
 from utils.technical_indicators import TechnicalIndicators
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Per-token ring buffers of recent price cycles fed to downstream vectorized math
+OHLCV_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+OHLCV_WINDOW = 720  # price cycles kept per token
+
+# Processed feature frames, one Parquet file per day under a directory per flag set and symbol
+PROCESSED_FEATURE_CACHE_DIR = "./cache/processed_features"
+
+# How aggregated sentiment columns collapse to one row per timestamp
+SENTIMENT_AGGREGATIONS = {
+    'news_sentiment': 'mean',
+    'news_relevance': 'mean',
+    'social_sentiment': 'first',
+    'social_mentions': 'first',
+    'social_engagement': 'first'
+}
+
+# Token-bucket limits per upstream API as (requests, period in seconds)
+RATE_LIMITS = {
+    'coingecko': (25, 60),
+    'defillama': (300, 60),
+    'newsapi': (100, 86400),
+    'cryptopanic': (5, 1)
+}
+RETRY_AFTER_DEFAULT = 60  # seconds to pause a source answering 429 without Retry-After
+
+# Columns written by the batched COPY ingest, in record order, and the
+# unique keys used to skip rows that are already stored
+PRICE_DATA_COLUMNS = (
+    'timestamp', 'symbol', 'open_price', 'high_price', 'low_price', 'close_price',
+    'volume', 'market_cap', 'source'
+)
+PRICE_DATA_KEY = ('timestamp', 'symbol', 'source')
+PROTOCOL_DATA_COLUMNS = (
+    'timestamp', 'protocol', 'tvl', 'apy', 'volume_24h', 'users_count',
+    'transactions_count', 'source'
+)
+PROTOCOL_DATA_KEY = ('timestamp', 'protocol', 'source')
+SOCIAL_DATA_COLUMNS = (
+    'timestamp', 'platform', 'symbol', 'mentions_count', 'sentiment_score',
+    'engagement_score', 'source'
+)
+SOCIAL_DATA_KEY = ('timestamp', 'platform', 'symbol', 'source')
+NEWS_DATA_COLUMNS = (
+    'timestamp', 'title', 'content', 'source', 'sentiment_score', 'relevance_score', 'symbols'
+)
+# Batches smaller than this go through a cached prepared INSERT instead of COPY
+COPY_MIN_ROWS = 100
+PRICE_PARTITION_DAYS_AHEAD = 2  # daily price_data partitions created ahead of the current day
+
+def insert_sql(table: str, columns: Tuple[str, ...], conflict_key: Optional[Tuple[str, ...]] = None) -> str:
+    """Positional INSERT for asyncpg, optionally skipping rows that conflict on `conflict_key`"""
+    placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    if conflict_key:
+        sql += f" ON CONFLICT ({', '.join(conflict_key)}) DO NOTHING"
+    return sql
+
+def naive_utc(timestamp: datetime) -> datetime:
+    """Convert an aware timestamp to naive UTC for the TIMESTAMP columns"""
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+def _msgpack_default(obj: Any) -> Any:
+    """Pack naive (local) datetimes as msgpack timestamps and anything else as a string"""
+    if isinstance(obj, datetime):
+        return obj.astimezone(timezone.utc)
+    return str(obj)
+
+def pack_cache_payload(data_point: Any) -> bytes:
+    """Serialize a data point for the Redis cache; read back with msgpack.unpackb(raw, timestamp=3)"""
+    return msgpack.packb(asdict(data_point), datetime=True, default=_msgpack_default)
+
+@dataclass(slots=True)
 class MarketDataPoint:
     timestamp: datetime
     symbol: str
@@ -36,19 +119,33 @@ class MarketDataPoint:
     source: str
     market_cap: Optional[float] = None
     circulating_supply: Optional[float] = None
+    
+    def as_row(self) -> tuple:
+        """Values in PRICE_DATA_COLUMNS order"""
+        return (
+            self.timestamp, self.symbol, self.open, self.high, self.low, self.close,
+            self.volume, self.market_cap, self.source
+        )
 
-@dataclass
+@dataclass(slots=True)
 class ProtocolDataPoint:
     timestamp: datetime
     protocol: str
     tvl: float
     apy: float
     volume_24h: float
+    source: str
     users_count: Optional[int] = None
     transactions_count: Optional[int] = None
-    source: str
+    
+    def as_row(self) -> tuple:
+        """Values in PROTOCOL_DATA_COLUMNS order"""
+        return (
+            self.timestamp, self.protocol, self.tvl, self.apy, self.volume_24h,
+            self.users_count, self.transactions_count, self.source
+        )
 
-@dataclass
+@dataclass(slots=True)
 class NewsDataPoint:
     timestamp: datetime
     title: str
@@ -57,8 +154,15 @@ class NewsDataPoint:
     sentiment_score: Optional[float] = None
     relevance_score: Optional[float] = None
     symbols: List[str] = None
+    
+    def as_row(self) -> tuple:
+        """Values in NEWS_DATA_COLUMNS order"""
+        return (
+            naive_utc(self.timestamp), self.title, self.content, self.source,
+            self.sentiment_score, self.relevance_score, self.symbols or []
+        )
 
-@dataclass
+@dataclass(slots=True)
 class SocialDataPoint:
     timestamp: datetime
     platform: str
@@ -67,6 +171,13 @@ class SocialDataPoint:
     sentiment_score: float
     engagement_score: float
     source: str
+    
+    def as_row(self) -> tuple:
+        """Values in SOCIAL_DATA_COLUMNS order"""
+        return (
+            self.timestamp, self.platform, self.symbol, self.mentions_count,
+            self.sentiment_score, self.engagement_score, self.source
+        )
 
 class DataPipeline:
     """Service for collecting and preprocessing market data from multiple sources"""
@@ -79,7 +190,14 @@ class DataPipeline:
         self.web3_clients = {}
         self.technical_indicators = TechnicalIndicators()
         self.session = None
-        self.executor = ThreadPoolExecutor(max_workers=10)
+        self.executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)  # CPU-bound indicator math
+        self._fetch_semaphore = asyncio.Semaphore(settings.FETCH_CONCURRENCY)
+        self._rng = np.random.default_rng()
+        self._rate_limiters = {
+            source: AsyncLimiter(max_rate, time_period)
+            for source, (max_rate, time_period) in RATE_LIMITS.items()
+        }
+        self._paused_until: Dict[str, float] = {}
         
         # Data collection status
         self.collection_status = {
@@ -93,9 +211,21 @@ class DataPipeline:
         self.data_cache = {
             'price_data': {},
             'protocol_data': {},
-            'news_data': [],
-            'social_data': []
+            'news_data': [],  # heap of (posix timestamp, seq, item); articles arrive out of order
+            'social_data': deque()  # appended in timestamp order
         }
+        self._news_seq = itertools.count()
+        self._last_price_hash: Dict[str, int] = {}
+        self._price_partitions_through: Optional[date] = None
+        
+        # Structure-of-arrays price history: one float32 row per token, one column per cycle
+        self._token_index = {token: i for i, token in enumerate(SUPPORTED_TOKENS)}
+        self._ohlcv = {
+            field: np.full((len(SUPPORTED_TOKENS), OHLCV_WINDOW), np.nan, dtype=np.float32)
+            for field in OHLCV_FIELDS
+        }
+        self._ohlcv_tail = 0
+        self._ohlcv_count = 0
     
     async def initialize(self):
         """Initialize the data pipeline"""
@@ -108,23 +238,36 @@ class DataPipeline:
             
             # Initialize database
             if settings.DATABASE_URL:
-                self.db_engine = create_async_engine(settings.DATABASE_URL)
+                # Run on asyncpg, which batches executemany natively and backs the COPY ingest
+                db_url = make_url(settings.DATABASE_URL)
+                if db_url.drivername in ('postgresql', 'postgresql+psycopg2'):
+                    db_url = db_url.set(drivername='postgresql+asyncpg')
+                self.db_engine = create_async_engine(db_url)
                 self.db_session = sessionmaker(
                     self.db_engine, class_=AsyncSession, expire_on_commit=False
                 )
                 logger.info("Database connection established")
             
-            # Initialize HTTP session
+            # Initialize HTTP session with pooled keep-alive connections and cached DNS
             self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=200,
+                    limit_per_host=64,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True
+                ),
+                cookie_jar=aiohttp.DummyCookieJar(),
                 timeout=aiohttp.ClientTimeout(total=30),
-                headers={'User-Agent': 'DefiBrain-AI/1.0'}
+                headers={'User-Agent': 'DefiBrain-AI/1.0'},
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
             )
             
             # Initialize exchanges
             await self._initialize_exchanges()
             
             # Initialize Web3 clients
-            self._initialize_web3_clients()
+            await self._initialize_web3_clients()
             
             # Create database tables if needed
             await self._create_tables()
@@ -155,8 +298,8 @@ class DataPipeline:
         except Exception as e:
             logger.error(f"Error initializing exchanges: {e}")
     
-    def _initialize_web3_clients(self):
-        """Initialize Web3 clients for different networks"""
+    async def _initialize_web3_clients(self):
+        """Initialize async Web3 clients for different networks on the shared HTTP session"""
         try:
             networks = {
                 'ethereum': settings.ETHEREUM_RPC_URL,
@@ -167,11 +310,12 @@ class DataPipeline:
             
             for network, rpc_url in networks.items():
                 if rpc_url:
-                    w3 = Web3(Web3.HTTPProvider(rpc_url))
+                    w3 = AsyncWeb3(AsyncHTTPProvider(rpc_url))
+                    await w3.provider.cache_async_session(self.session)
                     
                     # Add PoA middleware for some networks
                     if network in ['polygon', 'mantle']:
-                        w3.middleware_onion.inject(geth_poa_middleware, layer=0)
+                        w3.middleware_onion.inject(async_geth_poa_middleware, layer=0)
                     
                     self.web3_clients[network] = w3
                     logger.info(f"Web3 client initialized for {network}")
@@ -186,10 +330,10 @@ class DataPipeline:
         
         try:
             async with self.db_engine.begin() as conn:
-                # Create price data table
+                # Create price data table, range-partitioned by day on timestamp
                 await conn.execute(text("""
                     CREATE TABLE IF NOT EXISTS price_data (
-                        id SERIAL PRIMARY KEY,
+                        id SERIAL,
                         timestamp TIMESTAMP NOT NULL,
                         symbol VARCHAR(20) NOT NULL,
                         open_price DECIMAL(20, 8),
@@ -200,9 +344,13 @@ class DataPipeline:
                         market_cap DECIMAL(30, 2),
                         source VARCHAR(50),
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (id, timestamp),
                         UNIQUE(timestamp, symbol, source)
-                    )
+                    ) PARTITION BY RANGE (timestamp)
                 """))
+                await conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS price_data_timestamp_brin ON price_data USING BRIN (timestamp)"
+                ))
                 
                 # Create protocol data table
                 await conn.execute(text("""
@@ -256,6 +404,40 @@ class DataPipeline:
                 
         except Exception as e:
             logger.error(f"Error creating database tables: {e}")
+        
+        await self._ensure_price_partitions(datetime.now().date())
+    
+    async def _ensure_price_partitions(self, day: date):
+        """Create the daily price_data partitions from `day` through PRICE_PARTITION_DAYS_AHEAD days ahead"""
+        last_day = day + timedelta(days=PRICE_PARTITION_DAYS_AHEAD)
+        if not self.db_engine or (self._price_partitions_through and last_day <= self._price_partitions_through):
+            return
+        
+        try:
+            async with self.db_engine.begin() as conn:
+                partitioned = (await conn.execute(text(
+                    "SELECT relkind = 'p' FROM pg_class WHERE oid = 'price_data'::regclass"
+                ))).scalar()
+                if not partitioned:
+                    logger.warning("price_data was created before partitioning; skipping daily partitions")
+                    self._price_partitions_through = date.max
+                    return
+                
+                # Rows outside the daily partitions (e.g. backfills) land in the default partition
+                await conn.execute(text(
+                    "CREATE TABLE IF NOT EXISTS price_data_default PARTITION OF price_data DEFAULT"
+                ))
+                for offset in range(PRICE_PARTITION_DAYS_AHEAD + 1):
+                    start = day + timedelta(days=offset)
+                    await conn.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS price_data_{start:%Y%m%d} PARTITION OF price_data "
+                        f"FOR VALUES FROM ('{start}') TO ('{start + timedelta(days=1)}')"
+                    ))
+            
+            self._price_partitions_through = last_day
+            
+        except Exception as e:
+            logger.error(f"Error creating price data partitions: {e}")
     
     async def start_data_collection(self):
         """Start continuous data collection"""
@@ -282,16 +464,30 @@ class DataPipeline:
             try:
                 self.collection_status['price_data']['status'] = 'running'
                 
-                # Collect data for all supported tokens
-                for token in settings.SUPPORTED_TOKENS:
-                    try:
-                        data_point = await self._fetch_price_data(token)
-                        if data_point:
-                            await self._store_price_data(data_point)
-                            self.data_cache['price_data'][token] = data_point
-                    
-                    except Exception as e:
-                        logger.error(f"Error collecting price data for {token}: {e}")
+                # Collect data for all supported tokens, then store the cycle in one batch
+                data_points = []
+                now = datetime.now()
+                batch = await self._fetch_coingecko_batch(SUPPORTED_TOKENS, now)
+                for token, data_point in batch.items():
+                    data_points.append(data_point)
+                    self.data_cache['price_data'][token] = data_point
+                
+                # Fall back to per-token sources only for tokens CoinGecko did not return
+                missing = [token for token in SUPPORTED_TOKENS if token not in batch]
+                results = await asyncio.gather(
+                    *(self._fetch_price_data(token, now) for token in missing),
+                    return_exceptions=True
+                )
+                for token, data_point in zip(missing, results):
+                    if isinstance(data_point, Exception):
+                        logger.error(f"Error collecting price data for {token}: {data_point}")
+                    elif data_point:
+                        data_points.append(data_point)
+                        self.data_cache['price_data'][token] = data_point
+                
+                self._record_ohlcv(data_points)
+                await self._ensure_price_partitions(now.date())
+                await self._store_price_data(data_points)
                 
                 self.collection_status['price_data']['last_update'] = datetime.now()
                 self.collection_status['price_data']['status'] = 'idle'
@@ -303,68 +499,123 @@ class DataPipeline:
                 logger.error(f"Error in price data collection loop: {e}")
                 await asyncio.sleep(60)  # Wait before retrying
     
-    async def _fetch_price_data(self, token: str) -> Optional[MarketDataPoint]:
-        """Fetch price data for a token from multiple sources"""
-        try:
-            # Try CoinGecko first
-            coingecko_data = await self._fetch_from_coingecko(token)
-            if coingecko_data:
-                return coingecko_data
-            
-            # Try Binance
-            binance_data = await self._fetch_from_binance(token)
-            if binance_data:
-                return binance_data
-            
-            # Try Yahoo Finance for traditional assets
-            yahoo_data = await self._fetch_from_yahoo(token)
-            if yahoo_data:
-                return yahoo_data
-            
+    def _record_ohlcv(self, data_points: List[MarketDataPoint]):
+        """Write a price cycle into the OHLCV ring buffers; tokens missing from it get NaN"""
+        tail = self._ohlcv_tail
+        for array in self._ohlcv.values():
+            array[:, tail] = np.nan
+        
+        rows = []
+        values = []
+        for data_point in data_points:
+            row = self._token_index.get(data_point.symbol)
+            if row is not None:
+                rows.append(row)
+                values.append((data_point.open, data_point.high, data_point.low, data_point.close, data_point.volume))
+        
+        if rows:
+            values = np.array(values, dtype=np.float32)  # None becomes NaN
+            for j, field in enumerate(OHLCV_FIELDS):
+                self._ohlcv[field][rows, tail] = values[:, j]
+        
+        self._ohlcv_tail = (tail + 1) % OHLCV_WINDOW
+        self._ohlcv_count = min(self._ohlcv_count + 1, OHLCV_WINDOW)
+    
+    def get_ohlcv_window(self, symbol: str) -> Optional[Dict[str, np.ndarray]]:
+        """Get a token's recent price cycles as contiguous float32 arrays, oldest first"""
+        row = self._token_index.get(symbol)
+        if row is None:
             return None
+        
+        order = np.arange(self._ohlcv_tail - self._ohlcv_count, self._ohlcv_tail) % OHLCV_WINDOW
+        return {field: array[row, order] for field, array in self._ohlcv.items()}
+    
+    async def _fetch_price_data(self, token: str, timestamp: datetime) -> Optional[MarketDataPoint]:
+        """Fetch price data for a token from the fallback sources"""
+        try:
+            async with self._fetch_semaphore:
+                # Try Binance
+                binance_data = await self._fetch_from_binance(token, timestamp)
+                if binance_data:
+                    return binance_data
+                
+                # Try Yahoo Finance for traditional assets
+                yahoo_data = await self._fetch_from_yahoo(token)
+                if yahoo_data:
+                    return yahoo_data
+                
+                return None
             
         except Exception as e:
             logger.error(f"Error fetching price data for {token}: {e}")
             return None
     
-    async def _fetch_from_coingecko(self, token: str) -> Optional[MarketDataPoint]:
-        """Fetch data from CoinGecko API"""
+    async def _get_json(self, source: str, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """GET a JSON payload within the source's rate limit, skipping the source while a 429 pause lasts"""
+        # Fail fast while paused so callers fall back to other sources, and
+        # only spend limiter capacity on requests that are actually sent
+        if self._paused_until.get(source, 0) > time.monotonic():
+            return None
+        
+        async with self._rate_limiters[source]:
+            # A 429 may have landed while this call waited for capacity
+            if self._paused_until.get(source, 0) > time.monotonic():
+                return None
+            
+            async with self.session.get(url, params=params) as response:
+                if response.status == 429:
+                    retry_after = response.headers.get('Retry-After', '')
+                    pause = int(retry_after) if retry_after.isdigit() else RETRY_AFTER_DEFAULT
+                    self._paused_until[source] = time.monotonic() + pause
+                    logger.warning(f"Rate limited by {source}, pausing for {pause}s")
+                    return None
+                
+                if response.status != 200:
+                    return None
+                
+                return orjson.loads(await response.read())
+    
+    async def _fetch_coingecko_batch(self, tokens: List[str], timestamp: datetime) -> Dict[str, MarketDataPoint]:
+        """Fetch data for all tokens from CoinGecko in a single request"""
         try:
             url = f"https://api.coingecko.com/api/v3/simple/price"
             params = {
-                'ids': token.lower(),
+                'ids': ','.join(token.lower() for token in tokens),
                 'vs_currencies': 'usd',
                 'include_market_cap': 'true',
                 'include_24hr_vol': 'true',
                 'include_24hr_change': 'true'
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    if token.lower() in data:
-                        token_data = data[token.lower()]
-                        
-                        return MarketDataPoint(
-                            timestamp=datetime.now(),
-                            symbol=token,
-                            open=token_data['usd'],  # CoinGecko doesn't provide OHLC in simple API
-                            high=token_data['usd'],
-                            low=token_data['usd'],
-                            close=token_data['usd'],
-                            volume=token_data.get('usd_24h_vol', 0),
-                            market_cap=token_data.get('usd_market_cap'),
-                            source='coingecko'
-                        )
+            data = await self._get_json('coingecko', url, params)
+            if data is None:
+                return {}
             
-            return None
+            batch = {}
+            for token in tokens:
+                token_data = data.get(token.lower())
+                if not token_data or 'usd' not in token_data:
+                    continue
+                
+                batch[token] = MarketDataPoint(
+                    timestamp=timestamp,
+                    symbol=token,
+                    open=token_data['usd'],  # CoinGecko doesn't provide OHLC in simple API
+                    high=token_data['usd'],
+                    low=token_data['usd'],
+                    close=token_data['usd'],
+                    volume=token_data.get('usd_24h_vol', 0),
+                    market_cap=token_data.get('usd_market_cap'),
+                    source='coingecko'
+                )
+            
+            return batch
             
         except Exception as e:
-            logger.error(f"Error fetching from CoinGecko for {token}: {e}")
-            return None
+            logger.error(f"Error fetching batch from CoinGecko: {e}")
+            return {}
     
-    async def _fetch_from_binance(self, token: str) -> Optional[MarketDataPoint]:
+    async def _fetch_from_binance(self, token: str, timestamp: datetime) -> Optional[MarketDataPoint]:
         """Fetch data from Binance API"""
         try:
             if 'binance' not in self.exchanges:
@@ -378,7 +629,7 @@ class DataPipeline:
             
             if ticker:
                 return MarketDataPoint(
-                    timestamp=datetime.now(),
+                    timestamp=timestamp,
                     symbol=token,
                     open=ticker['open'],
                     high=ticker['high'],
@@ -411,17 +662,20 @@ class DataPipeline:
             try:
                 self.collection_status['protocol_data']['status'] = 'running'
                 
-                # Collect data for all supported protocols
-                for protocol in settings.SUPPORTED_PROTOCOLS:
+                # Collect data for all supported protocols, then store the cycle in one batch
+                data_points = []
+                for protocol in SUPPORTED_PROTOCOLS:
                     try:
                         data_point = await self._fetch_protocol_data(protocol)
                         if data_point:
-                            await self._store_protocol_data(data_point)
+                            data_points.append(data_point)
                             self.data_cache['protocol_data'][protocol] = data_point
                     
                     except Exception as e:
                         logger.error(f"Error collecting protocol data for {protocol}: {e}")
                 
+                await self._store_protocol_data(data_points)
+                
                 self.collection_status['protocol_data']['last_update'] = datetime.now()
                 self.collection_status['protocol_data']['status'] = 'idle'
                 
@@ -438,22 +692,20 @@ class DataPipeline:
             # Fetch from DeFiLlama
             url = f"https://api.llama.fi/protocol/{protocol}"
             
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # Get latest TVL data
-                    if 'tvl' in data and data['tvl']:
-                        latest_tvl = data['tvl'][-1]
-                        
-                        return ProtocolDataPoint(
-                            timestamp=datetime.fromtimestamp(latest_tvl['date']),
-                            protocol=protocol,
-                            tvl=latest_tvl['totalLiquidityUSD'],
-                            apy=0,  # Would need additional API calls for APY
-                            volume_24h=0,  # Would need additional data
-                            source='defillama'
-                        )
+            data = await self._get_json('defillama', url)
+            
+            # Get latest TVL data
+            if data and data.get('tvl'):
+                latest_tvl = data['tvl'][-1]
+                
+                return ProtocolDataPoint(
+                    timestamp=datetime.fromtimestamp(latest_tvl['date']),
+                    protocol=protocol,
+                    tvl=latest_tvl['totalLiquidityUSD'],
+                    apy=0,  # Would need additional API calls for APY
+                    volume_24h=0,  # Would need additional data
+                    source='defillama'
+                )
             
             return None
             
@@ -470,16 +722,15 @@ class DataPipeline:
                 # Collect news from multiple sources
                 news_items = await self._fetch_news_data()
                 
-                for news_item in news_items:
-                    await self._store_news_data(news_item)
-                    self.data_cache['news_data'].append(news_item)
+                await self._store_news_data(news_items)
+                news_cache = self.data_cache['news_data']
+                for item in news_items:
+                    heapq.heappush(news_cache, (item.timestamp.timestamp(), next(self._news_seq), item))
                 
-                # Keep only recent news in cache
-                cutoff_time = datetime.now() - timedelta(hours=24)
-                self.data_cache['news_data'] = [
-                    item for item in self.data_cache['news_data']
-                    if item.timestamp > cutoff_time
-                ]
+                # Keep only recent news in cache, popping just the expired entries
+                cutoff = time.time() - timedelta(hours=24).total_seconds()
+                while news_cache and news_cache[0][0] <= cutoff:
+                    heapq.heappop(news_cache)
                 
                 self.collection_status['news_data']['last_update'] = datetime.now()
                 self.collection_status['news_data']['status'] = 'idle'
@@ -523,21 +774,19 @@ class DataPipeline:
                 'apiKey': settings.NEWS_API_KEY
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    news_items = []
-                    for article in data.get('articles', []):
-                        news_items.append(NewsDataPoint(
-                            timestamp=datetime.fromisoformat(article['publishedAt'].replace('Z', '+00:00')),
-                            title=article['title'],
-                            content=article.get('description', ''),
-                            source=article['source']['name'],
-                            symbols=[]  # Would need NLP to extract symbols
-                        ))
-                    
-                    return news_items
+            data = await self._get_json('newsapi', url, params)
+            if data is not None:
+                news_items = []
+                for article in data.get('articles', []):
+                    news_items.append(NewsDataPoint(
+                        timestamp=datetime.fromisoformat(article['publishedAt'].replace('Z', '+00:00')),
+                        title=article['title'],
+                        content=article.get('description', ''),
+                        source=article['source']['name'],
+                        symbols=[]  # Would need NLP to extract symbols
+                    ))
+                
+                return news_items
             
             return []
             
@@ -556,21 +805,19 @@ class DataPipeline:
             }
             
             if settings.CRYPTOPANIC_API_KEY:
-                async with self.session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        news_items = []
-                        for post in data.get('results', []):
-                            news_items.append(NewsDataPoint(
-                                timestamp=datetime.fromisoformat(post['published_at'].replace('Z', '+00:00')),
-                                title=post['title'],
-                                content=post.get('title', ''),  # CryptoPanic doesn't provide full content
-                                source='cryptopanic',
-                                symbols=[coin['code'] for coin in post.get('currencies', [])]
-                            ))
-                        
-                        return news_items
+                data = await self._get_json('cryptopanic', url, params)
+                if data is not None:
+                    news_items = []
+                    for post in data.get('results', []):
+                        news_items.append(NewsDataPoint(
+                            timestamp=datetime.fromisoformat(post['published_at'].replace('Z', '+00:00')),
+                            title=post['title'],
+                            content=post.get('title', ''),  # CryptoPanic doesn't provide full content
+                            source='cryptopanic',
+                            symbols=[coin['code'] for coin in post.get('currencies', [])]
+                        ))
+                    
+                    return news_items
             
             return []
             
@@ -584,24 +831,18 @@ class DataPipeline:
             try:
                 self.collection_status['social_data']['status'] = 'running'
                 
-                # Collect social data for all supported tokens
-                for token in settings.SUPPORTED_TOKENS:
-                    try:
-                        social_items = await self._fetch_social_data(token)
-                        
-                        for social_item in social_items:
-                            await self._store_social_data(social_item)
-                            self.data_cache['social_data'].append(social_item)
-                    
-                    except Exception as e:
-                        logger.error(f"Error collecting social data for {token}: {e}")
+                # Collect social data for all supported tokens in one batch
+                now = datetime.now()
+                data_points = await self._fetch_social_data(SUPPORTED_TOKENS, now)
+                self.data_cache['social_data'].extend(data_points)
                 
-                # Keep only recent social data in cache
-                cutoff_time = datetime.now() - timedelta(hours=24)
-                self.data_cache['social_data'] = [
-                    item for item in self.data_cache['social_data']
-                    if item.timestamp > cutoff_time
-                ]
+                await self._store_social_data(data_points)
+                
+                # Keep only recent social data in cache, popping just the expired entries
+                social_cache = self.data_cache['social_data']
+                cutoff_time = now - timedelta(hours=24)
+                while social_cache and social_cache[0].timestamp <= cutoff_time:
+                    social_cache.popleft()
                 
                 self.collection_status['social_data']['last_update'] = datetime.now()
                 self.collection_status['social_data']['status'] = 'idle'
@@ -613,166 +854,195 @@ class DataPipeline:
                 logger.error(f"Error in social data collection loop: {e}")
                 await asyncio.sleep(900)  # Wait before retrying
     
-    async def _fetch_social_data(self, token: str) -> List[SocialDataPoint]:
-        """Fetch social media data for a token"""
+    async def _fetch_social_data(self, tokens: List[str], timestamp: datetime) -> List[SocialDataPoint]:
+        """Fetch social media data for a batch of tokens"""
         try:
             # For now, return simulated data
             # In production, you would integrate with Twitter API, Reddit API, etc.
             
-            social_items = []
-            
-            # Simulated Twitter data
-            social_items.append(SocialDataPoint(
-                timestamp=datetime.now(),
-                platform='twitter',
-                symbol=token,
-                mentions_count=np.random.randint(10, 1000),
-                sentiment_score=np.random.uniform(-1, 1),
-                engagement_score=np.random.uniform(0, 100),
-                source='simulated'
-            ))
-            
-            # Simulated Reddit data
-            social_items.append(SocialDataPoint(
-                timestamp=datetime.now(),
-                platform='reddit',
-                symbol=token,
-                mentions_count=np.random.randint(5, 500),
-                sentiment_score=np.random.uniform(-1, 1),
-                engagement_score=np.random.uniform(0, 100),
-                source='simulated'
-            ))
-            
-            return social_items
+            # Draw every token's Twitter and Reddit values at once, one column per platform
+            platforms = ('twitter', 'reddit')
+            size = (len(tokens), len(platforms))
+            mentions = self._rng.integers([10, 5], [1000, 500], size=size).tolist()
+            sentiment = self._rng.uniform(-1, 1, size=size).tolist()
+            engagement = self._rng.uniform(0, 100, size=size).tolist()
+            
+            return [
+                SocialDataPoint(
+                    timestamp=timestamp,
+                    platform=platform,
+                    symbol=token,
+                    mentions_count=mentions[i][j],
+                    sentiment_score=sentiment[i][j],
+                    engagement_score=engagement[i][j],
+                    source='simulated'
+                )
+                for i, token in enumerate(tokens)
+                for j, platform in enumerate(platforms)
+            ]
             
         except Exception as e:
-            logger.error(f"Error fetching social data for {token}: {e}")
+            logger.error(f"Error fetching social data: {e}")
             return []
     
-    async def _store_price_data(self, data_point: MarketDataPoint):
-        """Store price data in database and cache"""
+    async def _driver_connection(self, session: AsyncSession):
+        """Get the asyncpg connection underlying a session's transaction"""
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection
+    
+    async def _copy_into_table(
+        self,
+        session: AsyncSession,
+        table: str,
+        columns: Tuple[str, ...],
+        records: List[tuple],
+        conflict_key: Tuple[str, ...]
+    ):
+        """Bulk-load records with COPY into a staging table, then merge them into
+        `table` skipping rows that already exist (same semantics as ON CONFLICT)"""
+        driver_connection = await self._driver_connection(session)
+        
+        # Small batches are cheaper as one executemany than the four-statement staging dance
+        if len(records) < COPY_MIN_ROWS:
+            await driver_connection.executemany(insert_sql(table, columns, conflict_key), records)
+            return
+        
+        column_list = ", ".join(columns)
+        staging = f"{table}_staging"
+        await driver_connection.execute(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {column_list} FROM {table} WITH NO DATA"
+        )
+        await driver_connection.copy_records_to_table(staging, records=records, columns=list(columns))
+        await driver_connection.execute(f"""
+            INSERT INTO {table} ({column_list})
+            SELECT {column_list} FROM {staging}
+            ON CONFLICT ({", ".join(conflict_key)}) DO NOTHING
+        """)
+        await driver_connection.execute(f"DROP TABLE {staging}")
+    
+    async def _store_price_data(self, data_points: List[MarketDataPoint]):
+        """Store a cycle of price data in database and cache"""
+        if not data_points:
+            return
+        
         try:
-            # Store in Redis cache
-            if self.redis_client:
+            # Only write points whose values changed since the last stored cycle;
+            # unchanged ones just get their cache TTL refreshed
+            changed_points = []
+            unchanged_keys = []
+            changed_hashes = {}
+            for data_point in data_points:
                 cache_key = f"price:{data_point.symbol}:{data_point.source}"
-                await self.redis_client.setex(
-                    cache_key,
-                    settings.CACHE_TTL,
-                    json.dumps(asdict(data_point), default=str)
-                )
+                value_hash = hash((
+                    data_point.open, data_point.high, data_point.low, data_point.close,
+                    data_point.volume, data_point.market_cap
+                ))
+                if self._last_price_hash.get(cache_key) == value_hash:
+                    unchanged_keys.append(cache_key)
+                else:
+                    changed_points.append((cache_key, data_point))
+                    changed_hashes[cache_key] = value_hash
+            
+            # Store in Redis cache and publish changed points to subscribers with the
+            # same payload bytes, queuing every command into a single round trip
+            if self.redis_client:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for cache_key, data_point in changed_points:
+                        payload = pack_cache_payload(data_point)
+                        pipe.setex(cache_key, settings.CACHE_TTL, payload)
+                        pipe.publish(f"chan:price:{data_point.symbol}", payload)
+                    for cache_key in unchanged_keys:
+                        pipe.expire(cache_key, settings.CACHE_TTL)
+                    await pipe.execute()
             
             # Store in database
-            if self.db_session:
-                async with self.db_session() as session:
-                    await session.execute(text("""
-                        INSERT INTO price_data 
-                        (timestamp, symbol, open_price, high_price, low_price, close_price, volume, market_cap, source)
-                        VALUES (:timestamp, :symbol, :open, :high, :low, :close, :volume, :market_cap, :source)
-                        ON CONFLICT (timestamp, symbol, source) DO NOTHING
-                    """), {
-                        'timestamp': data_point.timestamp,
-                        'symbol': data_point.symbol,
-                        'open': data_point.open,
-                        'high': data_point.high,
-                        'low': data_point.low,
-                        'close': data_point.close,
-                        'volume': data_point.volume,
-                        'market_cap': data_point.market_cap,
-                        'source': data_point.source
-                    })
-                    await session.commit()
+            if self.db_session and changed_points:
+                async with self.db_session() as session, session.begin():
+                    await self._copy_into_table(session, 'price_data', PRICE_DATA_COLUMNS, [
+                        data_point.as_row() for _, data_point in changed_points
+                    ], PRICE_DATA_KEY)
+            
+            self._last_price_hash.update(changed_hashes)
             
         except Exception as e:
             logger.error(f"Error storing price data: {e}")
     
-    async def _store_protocol_data(self, data_point: ProtocolDataPoint):
-        """Store protocol data in database and cache"""
+    async def _store_protocol_data(self, data_points: List[ProtocolDataPoint]):
+        """Store a cycle of protocol data in database and cache"""
+        if not data_points:
+            return
+        
         try:
-            # Store in Redis cache
+            # Store in Redis cache, queuing every SETEX into a single round trip
             if self.redis_client:
-                cache_key = f"protocol:{data_point.protocol}:{data_point.source}"
-                await self.redis_client.setex(
-                    cache_key,
-                    settings.CACHE_TTL,
-                    json.dumps(asdict(data_point), default=str)
-                )
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for data_point in data_points:
+                        cache_key = f"protocol:{data_point.protocol}:{data_point.source}"
+                        pipe.setex(
+                            cache_key,
+                            settings.CACHE_TTL,
+                            pack_cache_payload(data_point)
+                        )
+                    await pipe.execute()
             
             # Store in database
             if self.db_session:
-                async with self.db_session() as session:
-                    await session.execute(text("""
-                        INSERT INTO protocol_data 
-                        (timestamp, protocol, tvl, apy, volume_24h, users_count, transactions_count, source)
-                        VALUES (:timestamp, :protocol, :tvl, :apy, :volume_24h, :users_count, :transactions_count, :source)
-                        ON CONFLICT (timestamp, protocol, source) DO NOTHING
-                    """), {
-                        'timestamp': data_point.timestamp,
-                        'protocol': data_point.protocol,
-                        'tvl': data_point.tvl,
-                        'apy': data_point.apy,
-                        'volume_24h': data_point.volume_24h,
-                        'users_count': data_point.users_count,
-                        'transactions_count': data_point.transactions_count,
-                        'source': data_point.source
-                    })
-                    await session.commit()
+                async with self.db_session() as session, session.begin():
+                    await self._copy_into_table(session, 'protocol_data', PROTOCOL_DATA_COLUMNS, [
+                        data_point.as_row() for data_point in data_points
+                    ], PROTOCOL_DATA_KEY)
             
         except Exception as e:
             logger.error(f"Error storing protocol data: {e}")
     
-    async def _store_news_data(self, data_point: NewsDataPoint):
-        """Store news data in database"""
+    async def _store_news_data(self, data_points: List[NewsDataPoint]):
+        """Store a cycle of news data in database"""
+        if not data_points:
+            return
+        
         try:
             if self.db_session:
-                async with self.db_session() as session:
-                    await session.execute(text("""
-                        INSERT INTO news_data 
-                        (timestamp, title, content, source, sentiment_score, relevance_score, symbols)
-                        VALUES (:timestamp, :title, :content, :source, :sentiment_score, :relevance_score, :symbols)
-                    """), {
-                        'timestamp': data_point.timestamp,
-                        'title': data_point.title,
-                        'content': data_point.content,
-                        'source': data_point.source,
-                        'sentiment_score': data_point.sentiment_score,
-                        'relevance_score': data_point.relevance_score,
-                        'symbols': data_point.symbols or []
-                    })
-                    await session.commit()
+                async with self.db_session() as session, session.begin():
+                    # News rows have no unique key, so write straight into the table
+                    driver_connection = await self._driver_connection(session)
+                    records = [data_point.as_row() for data_point in data_points]
+                    if len(records) < COPY_MIN_ROWS:
+                        # Connection.executemany prepares through the connection's statement
+                        # cache, so the plan is parsed once and reused on later cycles
+                        await driver_connection.executemany(insert_sql('news_data', NEWS_DATA_COLUMNS), records)
+                    else:
+                        await driver_connection.copy_records_to_table(
+                            'news_data', records=records, columns=list(NEWS_DATA_COLUMNS)
+                        )
             
         except Exception as e:
             logger.error(f"Error storing news data: {e}")
     
-    async def _store_social_data(self, data_point: SocialDataPoint):
-        """Store social data in database and cache"""
+    async def _store_social_data(self, data_points: List[SocialDataPoint]):
+        """Store a cycle of social data in database and cache"""
+        if not data_points:
+            return
+        
         try:
-            # Store in Redis cache
+            # Store in Redis cache, queuing every SETEX into a single round trip
             if self.redis_client:
-                cache_key = f"social:{data_point.platform}:{data_point.symbol}:{data_point.source}"
-                await self.redis_client.setex(
-                    cache_key,
-                    settings.CACHE_TTL,
-                    json.dumps(asdict(data_point), default=str)
-                )
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for data_point in data_points:
+                        cache_key = f"social:{data_point.platform}:{data_point.symbol}:{data_point.source}"
+                        pipe.setex(
+                            cache_key,
+                            settings.CACHE_TTL,
+                            pack_cache_payload(data_point)
+                        )
+                    await pipe.execute()
             
             # Store in database
             if self.db_session:
-                async with self.db_session() as session:
-                    await session.execute(text("""
-                        INSERT INTO social_data 
-                        (timestamp, platform, symbol, mentions_count, sentiment_score, engagement_score, source)
-                        VALUES (:timestamp, :platform, :symbol, :mentions_count, :sentiment_score, :engagement_score, :source)
-                        ON CONFLICT (timestamp, platform, symbol, source) DO NOTHING
-                    """), {
-                        'timestamp': data_point.timestamp,
-                        'platform': data_point.platform,
-                        'symbol': data_point.symbol,
-                        'mentions_count': data_point.mentions_count,
-                        'sentiment_score': data_point.sentiment_score,
-                        'engagement_score': data_point.engagement_score,
-                        'source': data_point.source
-                    })
-                    await session.commit()
+                async with self.db_session() as session, session.begin():
+                    await self._copy_into_table(session, 'social_data', SOCIAL_DATA_COLUMNS, [
+                        data_point.as_row() for data_point in data_points
+                    ], SOCIAL_DATA_KEY)
             
         except Exception as e:
             logger.error(f"Error storing social data: {e}")
@@ -802,39 +1072,50 @@ class DataPipeline:
             
             table_name = table_map[data_type]
             
-            # Build query
-            query = f"""
-                SELECT * FROM {table_name}
-                WHERE timestamp >= :start_date AND timestamp <= :end_date
-            """
-            
-            params = {
-                'start_date': start_date,
-                'end_date': end_date
-            }
+            # Build query with positional parameters for asyncpg
+            conditions = ["timestamp >= $1", "timestamp <= $2"]
+            args = [start_date, end_date]
             
             if data_type in ['price', 'social']:
-                query += " AND symbol = :symbol"
-                params['symbol'] = symbol
+                args.append(symbol)
+                conditions.append(f"symbol = ${len(args)}")
             elif data_type == 'protocol':
-                query += " AND protocol = :symbol"
-                params['symbol'] = symbol
+                args.append(symbol)
+                conditions.append(f"protocol = ${len(args)}")
             
             if source:
-                query += " AND source = :source"
-                params['source'] = source
+                args.append(source)
+                conditions.append(f"source = ${len(args)}")
+            
+            query = f"SELECT * FROM {table_name} WHERE {' AND '.join(conditions)} ORDER BY timestamp ASC"
+            
+            # Stream the result out with COPY and parse it column-wise with Arrow,
+            # so no Python object is built per row
+            chunks = []
             
-            query += " ORDER BY timestamp ASC"
+            async def collect(data: bytes):
+                chunks.append(data)
             
             async with self.db_session() as session:
-                result = await session.execute(text(query), params)
-                rows = result.fetchall()
-                
-                if rows:
-                    columns = result.keys()
-                    return pd.DataFrame(rows, columns=columns)
-                
-                return pd.DataFrame()
+                driver_connection = await self._driver_connection(session)
+                await driver_connection.copy_from_query(
+                    query, *args, output=collect, format='csv', header=True
+                )
+            
+            payload = b"".join(chunks)
+            chunks.clear()
+            table = pa_csv.read_csv(
+                pa.BufferReader(payload),
+                convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+            )
+            del payload
+            
+            if table.num_rows:
+                # Release each Arrow column as soon as it is converted to keep peak memory
+                # near one copy of the result
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+            
+            return pd.DataFrame()
             
         except Exception as e:
             logger.error(f"Error getting historical data: {e}")
@@ -850,19 +1131,39 @@ class DataPipeline:
     ) -> pd.DataFrame:
         """Get processed features for ML models"""
         try:
+            loop = asyncio.get_running_loop()
+            start_date, end_date = naive_utc(start_date), naive_utc(end_date)
+            cache_dir = self._processed_features_dir(symbol, include_technical, include_sentiment)
+            cached = await loop.run_in_executor(
+                self.executor, self._read_processed_features, cache_dir, symbol, start_date, end_date
+            )
+            if cached is not None:
+                return cached
+            
+            # Start the sentiment queries so they overlap the price query and indicator math
+            sentiment_task = None
+            if include_sentiment:
+                sentiment_task = asyncio.create_task(
+                    self._get_aggregated_sentiment(symbol, start_date, end_date)
+                )
+            
             # Get price data
             price_data = await self.get_historical_data('price', symbol, start_date, end_date)
             
             if price_data.empty:
+                if sentiment_task:
+                    sentiment_task.cancel()
                 return pd.DataFrame()
             
             # Add technical indicators
             if include_technical:
-                price_data = self.technical_indicators.add_all_indicators(price_data)
+                price_data = await loop.run_in_executor(
+                    self.executor, self.technical_indicators.add_all_indicators, price_data
+                )
             
             # Add sentiment data
-            if include_sentiment:
-                sentiment_data = await self._get_aggregated_sentiment(symbol, start_date, end_date)
+            if sentiment_task:
+                sentiment_data = await sentiment_task
                 if not sentiment_data.empty:
                     price_data = price_data.merge(
                         sentiment_data,
@@ -871,8 +1172,13 @@ class DataPipeline:
                         how='left'
                     )
             
-            # Fill missing values
-            price_data = price_data.fillna(method='ffill').fillna(method='bfill')
+            # Fill missing values in place rather than materializing an intermediate frame per pass
+            price_data.ffill(inplace=True)
+            price_data.bfill(inplace=True)
+            
+            await loop.run_in_executor(
+                self.executor, self._write_processed_features, cache_dir, price_data, start_date, end_date
+            )
             
             return price_data
             
@@ -880,6 +1186,100 @@ class DataPipeline:
             logger.error(f"Error getting processed features: {e}")
             return pd.DataFrame()
     
+    def _processed_features_dir(self, symbol: str, include_technical: bool, include_sentiment: bool) -> str:
+        """Parquet cache directory for one symbol and feature flag set"""
+        return os.path.join(PROCESSED_FEATURE_CACHE_DIR, f"{int(include_technical)}{int(include_sentiment)}", symbol)
+    
+    def _feature_buckets(self, start_date: datetime, end_date: datetime):
+        """Yield (day, bucket_start, bucket_end) for each day the naive range touches"""
+        day = start_date.date()
+        while day <= end_date.date():
+            yield (
+                day,
+                max(start_date, datetime.combine(day, datetime.min.time())),
+                min(end_date, datetime.combine(day, datetime.max.time()))
+            )
+            day += timedelta(days=1)
+    
+    def _read_processed_features(
+        self,
+        cache_dir: str,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[pd.DataFrame]:
+        """Read a cached feature range from its day buckets if every bucket covers and is fresh for it"""
+        last_update = self.collection_status['price_data']['last_update']
+        paths = []
+        for day, bucket_start, bucket_end in self._feature_buckets(start_date, end_date):
+            path = os.path.join(cache_dir, f"{day:%Y-%m-%d}.parquet")
+            if not os.path.exists(path):
+                return None
+            
+            try:
+                metadata = pq.read_schema(path).metadata or {}
+                covered_start = datetime.fromisoformat(metadata[b'covered_start'].decode())
+                covered_end = datetime.fromisoformat(metadata[b'covered_end'].decode())
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable feature cache {path}: {e}")
+                return None
+            if covered_start > bucket_start or covered_end < bucket_end:
+                return None
+            
+            # Fresh if the bucket's range had closed when it was written, or nothing was collected since
+            written_at = datetime.fromtimestamp(os.path.getmtime(path))
+            if written_at <= bucket_end and (last_update is None or written_at < last_update):
+                return None
+            paths.append(path)
+        
+        try:
+            dataset = pq.ParquetDataset(
+                paths,
+                memory_map=True,
+                filters=[
+                    ('symbol', '=', symbol),
+                    ('timestamp', '>=', start_date),
+                    ('timestamp', '<=', end_date)
+                ]
+            )
+            return dataset.read(use_pandas_metadata=True).to_pandas()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feature cache {cache_dir}: {e}")
+            return None
+    
+    def _write_processed_features(
+        self,
+        cache_dir: str,
+        features: pd.DataFrame,
+        start_date: datetime,
+        end_date: datetime
+    ):
+        """Persist a processed feature frame as one ZSTD-compressed Parquet file per day,
+        replacing whatever each day's bucket held before"""
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            days = features['timestamp'].dt.date
+            for day, bucket_start, bucket_end in self._feature_buckets(start_date, end_date):
+                rows = features[days == day]
+                if rows.empty:
+                    continue
+                table = pa.Table.from_pandas(rows, preserve_index=False)
+                # Record which part of the day this bucket was computed over
+                table = table.replace_schema_metadata({
+                    **(table.schema.metadata or {}),
+                    b'covered_start': bucket_start.isoformat().encode(),
+                    b'covered_end': bucket_end.isoformat().encode()
+                })
+                pq.write_table(
+                    table,
+                    os.path.join(cache_dir, f"{day:%Y-%m-%d}.parquet"),
+                    compression='zstd',
+                    row_group_size=65536,
+                    use_dictionary=True
+                )
+        except Exception as e:
+            logger.warning(f"Could not cache processed features to {cache_dir}: {e}")
+    
     async def _get_aggregated_sentiment(
         self,
         symbol: str,
@@ -888,42 +1288,42 @@ class DataPipeline:
     ) -> pd.DataFrame:
         """Get aggregated sentiment data"""
         try:
-            # Get news sentiment
-            news_data = await self.get_historical_data('news', symbol, start_date, end_date)
-            
-            # Get social sentiment
-            social_data = await self.get_historical_data('social', symbol, start_date, end_date)
+            # Get news and social sentiment concurrently
+            news_data, social_data = await asyncio.gather(
+                self.get_historical_data('news', symbol, start_date, end_date),
+                self.get_historical_data('social', symbol, start_date, end_date)
+            )
             
-            sentiment_records = []
+            sentiment_parts = []
             
             # Process news sentiment
             if not news_data.empty:
-                for _, row in news_data.iterrows():
-                    if row['sentiment_score'] is not None:
-                        sentiment_records.append({
-                            'timestamp': row['timestamp'],
-                            'news_sentiment': row['sentiment_score'],
-                            'news_relevance': row.get('relevance_score', 0.5)
-                        })
+                news_part = news_data.loc[
+                    news_data['sentiment_score'].notna(), ['timestamp', 'sentiment_score']
+                ].rename(columns={'sentiment_score': 'news_sentiment'})
+                news_part['news_relevance'] = (
+                    news_data['relevance_score'] if 'relevance_score' in news_data.columns else 0.5
+                )
+                sentiment_parts.append(news_part)
             
             # Process social sentiment
             if not social_data.empty:
-                social_agg = social_data.groupby('timestamp').agg({
-                    'sentiment_score': 'mean',
-                    'mentions_count': 'sum',
-                    'engagement_score': 'mean'
-                }).reset_index()
-                
-                for _, row in social_agg.iterrows():
-                    sentiment_records.append({
-                        'timestamp': row['timestamp'],
-                        'social_sentiment': row['sentiment_score'],
-                        'social_mentions': row['mentions_count'],
-                        'social_engagement': row['engagement_score']
-                    })
-            
-            if sentiment_records:
-                return pd.DataFrame(sentiment_records)
+                # DECIMAL columns arrive from COPY/Arrow as float64, so the groupby
+                # reductions already run in the compiled float path
+                social_agg = social_data.groupby('timestamp').agg(
+                    social_sentiment=('sentiment_score', 'mean'),
+                    social_mentions=('mentions_count', 'sum'),
+                    social_engagement=('engagement_score', 'mean')
+                ).reset_index()
+                
+                sentiment_parts.append(social_agg)
+            
+            if sentiment_parts:
+                # One float32 row per timestamp: news averaged, social already aggregated
+                sentiment = pd.concat(sentiment_parts, ignore_index=True).reindex(
+                    columns=['timestamp', *SENTIMENT_AGGREGATIONS]
+                ).astype({column: np.float32 for column in SENTIMENT_AGGREGATIONS})
+                return sentiment.groupby('timestamp', sort=False).agg(SENTIMENT_AGGREGATIONS).reset_index()
             
             return pd.DataFrame()
             
@@ -13,7 +13,7 @@ import ccxt.async_support as ccxt
 from web3 import Web3
 import time
 
-from config import settings, DATA_COLLECTION_INTERVALS
+from config import settings, DATA_COLLECTION_INTERVALS, SUPPORTED_TOKENS, SUPPORTED_PROTOCOLS
 
 logger = logging.getLogger(__name__)
 
@@ -693,8 +693,8 @@ class DataService:
     
     def get_supported_tokens(self) -> List[str]:
         """Get list of supported tokens"""
-        return settings.SUPPORTED_TOKENS
+        return list(SUPPORTED_TOKENS)
     
     def get_supported_protocols(self) -> List[str]:
         """Get list of supported DeFi protocols"""
-        return settings.SUPPORTED_PROTOCOLS
\ No newline at end of file
+        return list(SUPPORTED_PROTOCOLS)
\ No newline at end of file
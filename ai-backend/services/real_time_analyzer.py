@@ -13,7 +13,7 @@ from textblob import TextBlob
 import yfinance as yf
 from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
 
-from config import settings, DATA_COLLECTION_INTERVALS
+from config import settings, DATA_COLLECTION_INTERVALS, SUPPORTED_TOKENS
 from utils.technical_indicators import TechnicalIndicators
 from services.data_service import DataService
 
@@ -114,7 +114,7 @@ class RealTimeAnalyzer:
         """Collect real-time price data"""
         while self.is_running:
             try:
-                for token in settings.SUPPORTED_TOKENS:
+                for token in SUPPORTED_TOKENS:
                     # Get latest price data
                     price_data = await self._fetch_latest_price_data(token)
                     
@@ -303,7 +303,7 @@ class RealTimeAnalyzer:
         """Collect and analyze news sentiment"""
         while self.is_running:
             try:
-                for token in settings.SUPPORTED_TOKENS:
+                for token in SUPPORTED_TOKENS:
                     news_data = await self._fetch_news_data(token)
                     
                     if news_data:
@@ -416,7 +416,7 @@ class RealTimeAnalyzer:
             try:
                 # This would integrate with Twitter API, Reddit API, etc.
                 # For now, simulate social sentiment
-                for token in settings.SUPPORTED_TOKENS:
+                for token in SUPPORTED_TOKENS:
                     social_sentiment = await self._simulate_social_sentiment(token)
                     
                     if social_sentiment:
@@ -452,7 +452,7 @@ class RealTimeAnalyzer:
         """Process technical analysis indicators"""
         while self.is_running:
             try:
-                for token in settings.SUPPORTED_TOKENS:
+                for token in SUPPORTED_TOKENS:
                     # Get historical data for technical analysis
                     historical_data = await self.data_service.get_recent_price_data(token, hours=168)
                     
@@ -562,7 +562,7 @@ class RealTimeAnalyzer:
         """Generate composite market signals"""
         while self.is_running:
             try:
-                for token in settings.SUPPORTED_TOKENS:
+                for token in SUPPORTED_TOKENS:
                     composite_signal = await self._generate_composite_signal(token)
                     
                     if composite_signal: